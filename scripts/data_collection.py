@@ -26,7 +26,7 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def run_data_collection(countries, seasons, max_league_level, selected_tasks):
+async def run_data_collection(countries, seasons, max_league_level, selected_tasks, defer_game_indexes=False):
     """Run comprehensive data collection for specified countries, seasons, and league levels."""
     
     # Get credentials from environment
@@ -131,7 +131,9 @@ async def run_data_collection(countries, seasons, max_league_level, selected_tas
         
         if 5 in selected_tasks:
             print("🏈 Will run Task 5: Home Games Collection")
-            parallel_tasks.append(('games', collector.task_5_collect_home_games(target_team_ids, seasons)))
+            parallel_tasks.append(('games', collector.task_5_collect_home_games(
+                target_team_ids, seasons, defer_game_indexes=defer_game_indexes
+            )))
         
         # Execute parallel tasks
         if parallel_tasks:
@@ -341,6 +343,9 @@ Examples:
 
   %(prog)s --countries 1 --seasons 68 69 --tasks 5
       Resume collection: skip tasks 2,3,4 and only run home games collection
+
+  %(prog)s --countries 1 7 12 --seasons 60 61 62 --tasks 5 --defer-game-indexes
+      Backfill home games with the games indexes rebuilt once at the end
         """.strip()
     )
     
@@ -382,6 +387,13 @@ Examples:
         help='Tasks to run after Task 1 (always runs). Choose from: 2=team_info, 3=arena_snapshots, 4=team_history, 5=home_games, 6=game_pricing'
     )
     
+    parser.add_argument(
+        '--defer-game-indexes',
+        action='store_true',
+        help='Drop the games indexes during task 5 and rebuild them at the end (large backfills only; '
+             'do not use the API server against the same database meanwhile, it recreates the indexes)'
+    )
+    
     return parser.parse_args()
 
 if __name__ == "__main__":
@@ -400,4 +412,6 @@ if __name__ == "__main__":
             print("You may need to populate the league_hierarchy table first.")
         sys.exit(0)
     
-    asyncio.run(run_data_collection(args.countries, args.seasons, args.max_league_level, args.tasks))
\ No newline at end of file
+    asyncio.run(run_data_collection(
+        args.countries, args.seasons, args.max_league_level, args.tasks, args.defer_game_indexes
+    ))
\ No newline at end of file
@@ -6,6 +6,7 @@ for statistical analysis of arena demand, pricing, and other attributes.
 """
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -270,69 +271,51 @@ class DatabaseConverter:
         # Get all teams in the league
         team_ids = self.get_team_ids_for_league(season, league_id)
         
-        # Initialize standings
-        standings = {team_id: {'wins': 0, 'losses': 0, 'points_for': 0, 'points_against': 0} for team_id in team_ids}
-        
-        # Process games from rounds before the specified round
-        for round_info in rounds[:round_number-1]:  # rounds before the target round
-            for _, game in round_info['games'].iterrows():
-                home_team = game['home_team_id']
-                away_team = game['away_team_id']
-                home_score = game['score_home']
-                away_score = game['score_away']
-                
-                # Skip games without valid scores
-                if pd.isna(home_score) or pd.isna(away_score):
-                    continue
-                    
-                try:
-                    home_score = int(home_score)
-                    away_score = int(away_score)
-                except (ValueError, TypeError):
-                    continue
-                
-                # Update points for both teams
-                if home_team in standings:
-                    standings[home_team]['points_for'] += home_score
-                    standings[home_team]['points_against'] += away_score
-                if away_team in standings:
-                    standings[away_team]['points_for'] += away_score
-                    standings[away_team]['points_against'] += home_score
-                
-                # Determine winner and update standings
-                if home_score > away_score:
-                    # Home team wins
-                    if home_team in standings:
-                        standings[home_team]['wins'] += 1
-                    if away_team in standings:
-                        standings[away_team]['losses'] += 1
-                elif away_score > home_score:
-                    # Away team wins
-                    if away_team in standings:
-                        standings[away_team]['wins'] += 1
-                    if home_team in standings:
-                        standings[home_team]['losses'] += 1
-                # Note: ties are not counted as wins or losses
-        
-        # Convert to DataFrame
-        standings_list = []
-        for team_id, record in standings.items():
-            total_games = record['wins'] + record['losses']
-            win_pct = record['wins'] / total_games if total_games > 0 else 0.0
-            point_diff = record['points_for'] - record['points_against']
-            
-            standings_list.append({
-                'team_id': team_id,
-                'wins': record['wins'],
-                'losses': record['losses'],
-                'games_played': total_games,
-                'win_pct': win_pct,
-                'points_for': record['points_for'],
-                'points_against': record['points_against'],
-                'point_diff': point_diff
-            })
-        
-        standings_df = pd.DataFrame(standings_list)
+        # Games from the rounds before the target round that have both scores
+        played_games = [round_info['games'] for round_info in rounds[:round_number-1]]
+        games = pd.concat(played_games) if played_games else games_df.iloc[0:0]
+        scores = games[['home_team_id', 'away_team_id']].assign(
+            score_home=pd.to_numeric(games['score_home'], errors='coerce'),
+            score_away=pd.to_numeric(games['score_away'], errors='coerce'),
+        ).dropna(subset=['score_home', 'score_away'])
+        home_score = scores['score_home'].astype(int)
+        away_score = scores['score_away'].astype(int)
+        
+        # One row per team and game, seen from the home and the away side, so a single
+        # groupby builds every record (ties count as neither a win nor a loss)
+        team_games = pd.concat([
+            pd.DataFrame({
+                'team_id': scores['home_team_id'],
+                'wins': home_score > away_score,
+                'losses': home_score < away_score,
+                'points_for': home_score,
+                'points_against': away_score,
+            }),
+            pd.DataFrame({
+                'team_id': scores['away_team_id'],
+                'wins': away_score > home_score,
+                'losses': away_score < home_score,
+                'points_for': away_score,
+                'points_against': home_score,
+            }),
+        ])
+        
+        # Only league teams get a row, and teams without played games start at zero
+        standings_df = (
+            team_games.groupby('team_id')[['wins', 'losses', 'points_for', 'points_against']].sum()
+            .reindex(team_ids, fill_value=0)
+            .astype(int)
+            .rename_axis('team_id')
+            .reset_index()
+        )
+        standings_df['games_played'] = standings_df['wins'] + standings_df['losses']
+        # 0 / 0 gives NaN for teams without games, which counts as a 0.0 win percentage
+        standings_df['win_pct'] = (standings_df['wins'] / standings_df['games_played']).fillna(0.0)
+        standings_df['point_diff'] = standings_df['points_for'] - standings_df['points_against']
+        standings_df = standings_df[[
+            'team_id', 'wins', 'losses', 'games_played', 'win_pct',
+            'points_for', 'points_against', 'point_diff'
+        ]]
         
         # Sort by win percentage (descending), then by point differential (descending), then by wins (descending)
         standings_df = standings_df.sort_values(['win_pct', 'point_diff', 'wins'], ascending=[False, False, False])
@@ -422,15 +405,22 @@ class DatabaseConverter:
     
     def get_all_tables(self) -> Dict[str, pd.DataFrame]:
         """Get all tables as a dictionary of DataFrames."""
-        tables = {
-            'games': self.get_games_df(),
-            'arena_snapshots': self.get_arena_snapshots_df(),
-            'price_snapshots': self.get_price_snapshots_df(),
-            'team_info': self.get_team_info_df(),
-            'team_league_history': self.get_team_league_history_df(),
-            'league_hierarchy': self.get_league_hierarchy_df(),
-            'seasons': self.get_seasons_df()
+        loaders = {
+            'games': self.get_games_df,
+            'arena_snapshots': self.get_arena_snapshots_df,
+            'price_snapshots': self.get_price_snapshots_df,
+            'team_info': self.get_team_info_df,
+            'team_league_history': self.get_team_league_history_df,
+            'league_hierarchy': self.get_league_hierarchy_df,
+            'seasons': self.get_seasons_df
         }
+        
+        # The loads are independent reads, each on its own connection, and SQLite
+        # releases the GIL while it runs a query, so they can overlap in threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {name: executor.submit(loader) for name, loader in loaders.items()}
+        
+        tables = {name: future.result() for name, future in futures.items()}
         return tables
     
     def list_tables(self) -> List[str]:
@@ -1,14 +1,76 @@
 """BuzzerBeater API client for arena and team data."""
 
+import json
 import logging
 import datetime
+import os
+import re
+import sqlite3
+from itertools import islice
+from pathlib import Path
 from typing import Any, TypedDict
 from xml.etree import ElementTree as ET
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Team history page patterns, compiled once instead of on every scraped page
+_SEASON_MENTION_RE = re.compile(r'season \d+', re.IGNORECASE)
+_LEAGUE_WORD_RE = re.compile('league', re.IGNORECASE)
+# Handles team names with commas and allows periods in league names. Possessive
+# quantifiers on the runs that can never need to give characters back keep a
+# non-matching line from backtracking through every split of them.
+_SEASON_LEAGUE_RE = re.compile(
+    r'In season (\d++), (.+?)\s+(?:were|was|made|won|lost|played|finished).*?(?:in|from|of)\s++league\s++([^,]+?)(?:,|$)',
+    re.IGNORECASE
+)
+_LEAGUE_HREF_RE = re.compile(r'/league/(\d+)')
+_TOURNAMENT_FINAL_RE = re.compile(r'final (\d+) teams')
+
+# Season summary phrases and the achievement they denote; the first match wins,
+# so semifinal runs are checked before the more generic playoff phrase
+_ACHIEVEMENT_PHRASES = (
+    ("crowned champions", "Champions"),
+    ("semifinals of the playoffs", "Semifinals"),
+    ("made the playoffs", "Playoffs"),
+    ("relegation series to stay", "Survived relegation"),
+    ("relegated from", "Relegated"),
+)
+
+# Division numerals in league names such as "USA III.1"
+_ROMAN_DIVISION_RE = re.compile(r' ([IVX]++)\.')
+_ROMAN_LEVELS = {
+    'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
+    'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10
+}
+
+# Project database holding the league hierarchy used to resolve league levels
+_LEAGUE_DB_PATH = Path(__file__).parent.parent.parent.parent / "bb_arena_data.db"
+
+
+def create_http_adapter(pool_size: int = 16) -> HTTPAdapter:
+    """Create an HTTP adapter with a sized connection pool and retries for idempotent GETs.
+
+    Args:
+        pool_size: Number of connections kept per host; should cover the
+            number of requests a collector runs concurrently
+
+    Returns:
+        HTTPAdapter to mount on a requests.Session for http:// and https://
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        # Let raise_for_status report the final response instead of raising RetryError
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+
 
 class BoxscoreData(TypedDict):
     """Typed structure for boxscore data from BB API."""
@@ -44,6 +106,22 @@ class ScheduleData(TypedDict):
     matches: list[ScheduleMatchData]
 
 
+def _boxscore_cache_path(game_id: str) -> Path | None:
+    """Get the on-disk cache path of a game's boxscore, or None if caching is disabled."""
+    cache_dir = os.getenv("BB_BOXSCORE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{game_id}.json"
+
+
+def _schedule_cache_path(team_id: int, season: int) -> Path | None:
+    """Get the on-disk cache path of a team's season schedule, or None if caching is disabled."""
+    cache_dir = os.getenv("BB_SCHEDULE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{team_id}-{season}.json"
+
+
 class BuzzerBeaterAPI:
     """BuzzerBeater API client for arena and team data."""
 
@@ -59,7 +137,13 @@ class BuzzerBeaterAPI:
         self.username = username
         self.security_code = security_code
         self.session = requests.Session()
+        adapter = create_http_adapter()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._authenticated = False
+        # Successful responses memoized for the lifetime of this client
+        self._schedule_cache: dict[tuple[int | None, int | None], ScheduleData] = {}
+        self._team_info_cache: dict[int | None, dict[str, Any]] = {}
 
     def login(self) -> bool:
         """Authenticate with the BuzzerBeater API.
@@ -159,18 +243,69 @@ class BuzzerBeaterAPI:
 
         return self._parse_arena_data(root)
 
+    def get_cached_schedule(
+        self, team_id: int | None = None, season: int | None = None, finished: bool = False
+    ) -> ScheduleData | None:
+        """Get a team schedule from the memo or on-disk cache without any request.
+
+        Args:
+            team_id: Optional team ID (defaults to current user's team)
+            season: Optional season number (defaults to current season)
+            finished: Whether the season is over, which allows the on-disk cache
+
+        Returns:
+            The cached ScheduleData, or None if get_schedule would have to request it
+        """
+        cache_key = (team_id, season)
+        if cache_key in self._schedule_cache:
+            return self._schedule_cache[cache_key]
+
+        cache_path = (
+            _schedule_cache_path(team_id, season)
+            if finished and team_id and season
+            else None
+        )
+        if cache_path is not None and cache_path.exists():
+            try:
+                cached: ScheduleData = json.loads(cache_path.read_text(encoding="utf-8"))
+                self._schedule_cache[cache_key] = cached
+                return cached
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cached schedule {cache_path}: {e}")
+
+        return None
+
     def get_schedule(
-        self, team_id: int | None = None, season: int | None = None
+        self, team_id: int | None = None, season: int | None = None, finished: bool = False
     ) -> ScheduleData | None:
         """Get team schedule with typed return structure.
         
+        Repeated calls for the same team and season on one client reuse the
+        first successful response; open a new client to see later results.
+        
+        Schedules of finished seasons can also be kept on disk: set
+        BB_SCHEDULE_CACHE_DIR to a directory and pass finished=True. Such a
+        schedule never changes, so cached entries are reused without expiry.
+        
         Args:
             team_id: Optional team ID (defaults to current user's team)
             season: Optional season number (defaults to current season)
+            finished: Whether the season is over, which allows the on-disk cache
             
         Returns:
             ScheduleData with typed matches or None if error
         """
+        cached = self.get_cached_schedule(team_id, season, finished=finished)
+        if cached is not None:
+            return cached
+
+        cache_key = (team_id, season)
+        cache_path = (
+            _schedule_cache_path(team_id, season)
+            if finished and team_id and season
+            else None
+        )
+
         params = {}
         if team_id:
             params["teamid"] = team_id
@@ -182,41 +317,79 @@ class BuzzerBeaterAPI:
         if root is None:
             return None
 
-        return self._parse_schedule_data(root, season or 0)
+        schedule = self._parse_schedule_data(root, season or 0)
+        self._schedule_cache[cache_key] = schedule
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(schedule), encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"Could not cache schedule for team {team_id}, season {season}: {e}")
+
+        return schedule
 
     def get_team_info(self, team_id: int | None = None) -> dict[str, Any] | None:
         """Get basic team information.
 
+        Team info is memoized per client, so each team is requested at most once.
+
         Args:
             team_id: Optional team ID (defaults to current user's team)
 
         Returns:
             Dictionary with team data or None if error
         """
+        if team_id in self._team_info_cache:
+            return self._team_info_cache[team_id]
+
         params = {"teamid": team_id} if team_id else {}
         root = self._make_request("teaminfo.aspx", params)
 
         if root is None:
             return None
 
-        return self._parse_team_data(root)
+        team_data = self._parse_team_data(root)
+        self._team_info_cache[team_id] = team_data
+        return team_data
 
     def get_boxscore(self, game_id: str) -> BoxscoreData | None:
         """Get detailed boxscore for a specific game including attendance.
 
+        Caching is opt-in: set BB_BOXSCORE_CACHE_DIR to a directory to keep parsed
+        boxscores on disk. Only played games parse successfully, and their
+        boxscores never change, so cached entries are reused without expiry.
+
         Args:
             game_id: The game ID to get boxscore for
 
         Returns:
             Dictionary with boxscore data including attendance or None if error
         """
+        cache_path = _boxscore_cache_path(game_id)
+        if cache_path is not None and cache_path.exists():
+            try:
+                cached: BoxscoreData = json.loads(cache_path.read_text(encoding="utf-8"))
+                return cached
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cached boxscore {cache_path}: {e}")
+
         params = {"matchid": game_id}
         root = self._make_request("boxscore.aspx", params)
 
         if root is None:
             return None
 
-        return self._parse_boxscore_data(root)
+        boxscore = self._parse_boxscore_data(root)
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps(boxscore), encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"Could not cache boxscore for game {game_id}: {e}")
+
+        return boxscore
 
     def get_league_standings(
         self, league_id: int, season: int | None = None
@@ -491,15 +664,21 @@ class BuzzerBeaterAPI:
         Returns:
             List of dictionaries with team history data
         """
-        import re
-        from bs4 import BeautifulSoup, Tag
+        from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
         
         try:
             url = f"https://buzzerbeater.com/team/{team_id}/history.aspx"
             response = self.session.get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Only build a tree for the main container; navigation, scripts and
+            # sidebars elsewhere on the page are never needed
+            container_only = SoupStrainer('div', id='containerDiv')
+            try:
+                # lxml's C parser is much faster than the pure-Python html.parser
+                soup = BeautifulSoup(response.text, 'lxml', parse_only=container_only)
+            except FeatureNotFound:
+                soup = BeautifulSoup(response.text, 'html.parser', parse_only=container_only)
             
             # Find the main container div
             container_div = soup.find('div', id='containerDiv')
@@ -509,17 +688,31 @@ class BuzzerBeaterAPI:
             
             # Find the div with class 'boxcontent' that contains the season history
             history_div = None
+            history_text = ""
             boxcontent_divs = container_div.find_all('div', class_='boxcontent')
+            # A nested box's text is part of its enclosing box's text, so once a box is
+            # rejected none of the boxes inside it can qualify; skip them without
+            # walking their text again
+            rejected_ids: set[int] = set()
             for div in boxcontent_divs:
                 if not isinstance(div, Tag):
                     continue
+                enclosing_box = div.find_parent('div', class_='boxcontent')
+                if enclosing_box is not None and id(enclosing_box) in rejected_ids:
+                    rejected_ids.add(id(div))
+                    continue
                 div_text = div.get_text()
-                if 'season' in div_text.lower() and 'league' in div_text.lower():
-                    # Count season references to find the main history div
-                    season_count = len(re.findall(r'season \d+', div_text, re.IGNORECASE))
-                    if season_count > 10:  # The main history div should have many seasons
+                # The case-insensitive season pattern already implies 'season' is present,
+                # so one case-insensitive scan for 'league' is the only pre-check needed;
+                # the regex avoids building a lowercased copy of every box's text
+                if _LEAGUE_WORD_RE.search(div_text):
+                    # Count season references to find the main history div; stop at 11
+                    season_mentions = islice(_SEASON_MENTION_RE.finditer(div_text), 11)
+                    if sum(1 for _ in season_mentions) > 10:  # The main history div should have many seasons
                         history_div = div
+                        history_text = div_text
                         break
+                rejected_ids.add(id(div))
             
             if not history_div:
                 logger.error("Could not find history div with season content")
@@ -529,25 +722,18 @@ class BuzzerBeaterAPI:
             
             history_entries = []
             
-            # Use raw text parsing approach
-            container_text = history_div.get_text()
-            lines = container_text.split('\n')
-            
-            # Pattern to match season entries with league information
-            # Improved pattern that handles team names with commas and allows periods in league names
-            season_league_pattern = re.compile(
-                r'In season (\d+), (.+?)\s+(?:were|was|made|won|lost|played|finished).*?(?:in|from|of)\s+league\s+([^,]+?)(?:,|$)',
-                re.IGNORECASE
-            )
+            # Use raw text parsing approach; the div's text was already extracted while
+            # searching for it, so reuse it instead of walking the subtree again
+            lines = history_text.split('\n')
             
             # Get league IDs from the links
-            league_links = history_div.find_all('a', href=re.compile(r'/league/(\d+)'))
+            league_links = history_div.find_all('a', href=_LEAGUE_HREF_RE)
             league_id_map = {}
             
             for link in league_links:
                 href = link.get('href')
-                league_name = link.get_text().strip()
-                league_id_match = re.search(r'/league/(\d+)', href)
+                league_name = link.get_text(strip=True)
+                league_id_match = _LEAGUE_HREF_RE.search(href)
                 if league_id_match:
                     league_id = int(league_id_match.group(1))
                     league_id_map[league_name] = league_id
@@ -556,7 +742,7 @@ class BuzzerBeaterAPI:
             
             for line in lines:
                 line = line.strip()
-                match = season_league_pattern.search(line)
+                match = _SEASON_LEAGUE_RE.search(line)
                 
                 if match:
                     season = int(match.group(1))
@@ -584,21 +770,16 @@ class BuzzerBeaterAPI:
                     
                     # Extract achievement from the text
                     achievement = ""
-                    if "crowned champions" in line:
-                        achievement = "Champions"
-                    elif "semifinals of the playoffs" in line:
-                        achievement = "Semifinals"
-                    elif "made the playoffs" in line and "semifinals" not in line:
-                        achievement = "Playoffs"
-                    elif "relegation series to stay" in line:
-                        achievement = "Survived relegation"
-                    elif "relegated from" in line:
-                        achievement = "Relegated"
-                    elif "final" in line and "teams" in line:
-                        # Extract tournament achievement like "final 512 teams"
-                        final_match = re.search(r'final (\d+) teams', line)
-                        if final_match:
-                            achievement = f"Tournament Round of {final_match.group(1)}"
+                    for phrase, label in _ACHIEVEMENT_PHRASES:
+                        if phrase in line:
+                            achievement = label
+                            break
+                    else:
+                        if "final" in line and "teams" in line:
+                            # Extract tournament achievement like "final 512 teams"
+                            final_match = _TOURNAMENT_FINAL_RE.search(line)
+                            if final_match:
+                                achievement = f"Tournament Round of {final_match.group(1)}"
                     
                     entry = {
                         'season': season,
@@ -630,10 +811,10 @@ class BuzzerBeaterAPI:
 
     def _calculate_league_level(self, league_name: str, league_id: int | None = None) -> int:
         """
-        Calculate league level using three-tier approach:
-        1. First try database lookup if league_id exists (for any level)
-        2. Check if the league_id is in the level 1 league table
-        3. Finally try Roman numeral parsing
+        Calculate league level using two-tier approach:
+        1. First try database lookup if league_id exists (for any level,
+           including the authoritative level 1 leagues)
+        2. Finally try Roman numeral parsing
         """
         if not league_name:
             return 0
@@ -641,14 +822,7 @@ class BuzzerBeaterAPI:
         # Tier 1: Database lookup by league_id if available (for any level)
         if league_id:
             try:
-                import sqlite3
-                from pathlib import Path
-                
-                # Get database path
-                project_root = Path(__file__).parent.parent.parent.parent
-                db_path = project_root / "bb_arena_data.db"
-                
-                with sqlite3.connect(db_path) as conn:
+                with sqlite3.connect(_LEAGUE_DB_PATH) as conn:
                     cursor = conn.cursor()
                     
                     # Direct lookup by league_id (if we somehow have league levels for other leagues)
@@ -667,48 +841,14 @@ class BuzzerBeaterAPI:
             except Exception as e:
                 logger.debug(f"Database lookup failed: {e}")
         
-        # Tier 2: Check if this is a level 1 league using our authoritative level 1 database
-        if league_id:
-            try:
-                import sqlite3
-                from pathlib import Path
-                
-                # Get database path
-                project_root = Path(__file__).parent.parent.parent.parent
-                db_path = project_root / "bb_arena_data.db"
-                
-                with sqlite3.connect(db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Check if this league_id is a level 1 league
-                    cursor.execute(
-                        "SELECT 1 FROM league_hierarchy WHERE league_id = ? AND league_level = 1", 
-                        (league_id,)
-                    )
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        logger.debug(f"Confirmed league_id {league_id} is level 1 from authoritative database")
-                        return 1
-                    
-                    logger.debug(f"League_id {league_id} is not in level 1 database")
-                    
-            except Exception as e:
-                logger.debug(f"Level 1 database lookup failed: {e}")
-        
-        # Tier 3: Roman numeral parsing (fallback for non-level-1 leagues)
+        # Tier 2: Roman numeral parsing (fallback for leagues not in the database)
         logger.debug(f"Falling back to Roman numeral parsing for '{league_name}'")
         
-        # Roman numeral parsing
-        roman_to_int = {
-            'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
-            'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10
-        }
-        
-        # Look for Roman numerals in the league name
-        for roman, level in roman_to_int.items():
-            if f' {roman}.' in league_name:
-                logger.debug(f"Parsed Roman numeral '{roman}' from '{league_name}' -> level {level}")
+        # Look for Roman numerals in the league name: one scan, then a dict lookup per candidate
+        for roman_match in _ROMAN_DIVISION_RE.finditer(league_name):
+            level = _ROMAN_LEVELS.get(roman_match.group(1))
+            if level is not None:
+                logger.debug(f"Parsed Roman numeral '{roman_match.group(1)}' from '{league_name}' -> level {level}")
                 return level
         
         # If no pattern matches, assume level 1 (first division)
@@ -1,16 +1,25 @@
 """API router for collecting arena data and updating pricing."""
 
+import asyncio
+import gzip
+import json
 import logging
+import os
+import time
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Dict
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from ...api.client import create_http_adapter
 from ...storage.database import DatabaseManager
 from ...collecting.arena_table_parser import ArenaTableIsolator
-from ...collecting.arena_row import ArenaRowParser
+from ...collecting.arena_row import ArenaRowParser, GameEvent, PriceChange
 from ...collecting.price_period import build_price_periods_from_data
+from ...collecting.task_based_collector import RateLimitConfig
 from ...utils.datetime_utils import get_bb_timezone_from_html
 
 logger = logging.getLogger(__name__)
@@ -20,6 +29,53 @@ router = APIRouter(
     tags=["collecting"]
 )
 
+# Shared session so arena page fetches reuse pooled keep-alive connections,
+# including when several teams are fetched from worker threads at once.
+# Accept-Encoding is left to requests, which only offers br (Brotli) when a
+# decoder is installed; advertising it unconditionally could return undecodable bodies.
+_arena_session = requests.Session()
+_arena_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+# Most arena pages a batch update may fetch at once; the collector's cap for webpage scrapes
+_ARENA_MAX_CONCURRENCY = RateLimitConfig.max_concurrent_requests
+# The pool is sized to that cap, so every concurrent fetch keeps its own reusable
+# TLS connection instead of being discarded
+_arena_session.mount("https://", create_http_adapter(pool_size=_ARENA_MAX_CONCURRENCY))
+
+# Response headers stored with cached arena pages and the request headers that
+# send them back for a conditional GET
+_VALIDATOR_HEADERS = (('ETag', 'If-None-Match'), ('Last-Modified', 'If-Modified-Since'))
+
+# Minimum gap (seconds) between arena fetch starts in batch updates. It matches the
+# collector's spacing for the same pages and does not shrink with max_concurrency,
+# so raising concurrency only overlaps latency and never raises the request rate
+_ARENA_REQUEST_DELAY = RateLimitConfig.min_delay_between_requests
+
+
+class _RequestSpacer:
+    """Spaces request starts evenly across concurrent callers sharing one budget."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Wait until this caller's slot in the shared schedule comes up."""
+        # Reserve the next start time under the lock, then sleep outside it so
+        # waiting callers don't hold each other up beyond their own slot
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 class ArenaUpdateRequest(BaseModel):
     team_id: int
 
@@ -29,6 +85,15 @@ class ArenaUpdateResponse(BaseModel):
     periods_created: int
     games_updated: int
 
+class ArenaBatchUpdateRequest(BaseModel):
+    team_ids: list[int]
+    max_concurrency: int = Field(default=_ARENA_MAX_CONCURRENCY, ge=1, le=_ARENA_MAX_CONCURRENCY)
+
+class ArenaBatchUpdateResponse(BaseModel):
+    message: str
+    results: list[ArenaUpdateResponse]
+    failed_teams: Dict[int, str]
+
 @router.post("/update-pricing-from-arena", response_model=ArenaUpdateResponse)
 async def update_pricing_from_arena_webpage(request: ArenaUpdateRequest) -> ArenaUpdateResponse:
     """
@@ -41,63 +106,10 @@ async def update_pricing_from_arena_webpage(request: ArenaUpdateRequest) -> Aren
         Summary of the update operation
     """
     try:
-        logger.info(f"🔄 Starting arena pricing update for team {request.team_id}")
-        
         # Initialize database manager
         db_manager = DatabaseManager("bb_arena_data.db")
         
-        # Fetch arena webpage
-        logger.info(f"📥 Fetching arena webpage for team {request.team_id}")
-        html_content = _fetch_arena_webpage(request.team_id)
-        
-        # Parse the arena table
-        logger.info("🔍 Parsing arena table from HTML")
-        arena_table = ArenaTableIsolator.find_attendance_table(html_content)
-        
-        if not arena_table:
-            raise HTTPException(status_code=404, detail="Arena table not found on webpage")
-        
-        # Parse arena rows
-        arena_rows = ArenaRowParser.parse_data_rows(arena_table)
-        
-        if not arena_rows:
-            raise HTTPException(status_code=404, detail="No arena data found in table")
-        
-        logger.info(f"📊 Found {len(arena_rows)} arena rows")
-        
-        # Detect timezone from HTML
-        timezone_str = get_bb_timezone_from_html(html_content)
-        logger.info(f"🌍 Detected timezone: {timezone_str}")
-        
-        # Create price periods
-        logger.info("🏗️ Creating price periods from arena data")
-        periods = build_price_periods_from_data(
-            arena_rows, 
-            db_manager, 
-            str(request.team_id), 
-            timezone_str
-        )
-        
-        logger.info(f"✅ Created {len(periods)} price periods")
-        
-        # Update game pricing for each period
-        total_games_updated = 0
-        for period in periods:
-            update_results = period.update_game_pricing()
-            games_updated = sum(1 for success in update_results.values() if success)
-            total_games_updated += games_updated
-            logger.info(f"💰 Updated pricing for {games_updated} games in period {period.period_id} "
-                       f"({period.safe_start.date()} - {period.safe_end.date()})")
-        
-        logger.info(f"🎉 Arena pricing update completed for team {request.team_id}. "
-                   f"Created {len(periods)} periods, updated {total_games_updated} games")
-        
-        return ArenaUpdateResponse(
-            message="Arena pricing updated successfully",
-            team_id=request.team_id,
-            periods_created=len(periods),
-            games_updated=total_games_updated
-        )
+        return await _update_team_pricing_from_arena(request.team_id, db_manager)
         
     except requests.RequestException as e:
         logger.error(f"❌ Failed to fetch arena webpage for team {request.team_id}: {e}")
@@ -108,12 +120,203 @@ async def update_pricing_from_arena_webpage(request: ArenaUpdateRequest) -> Aren
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
-def _fetch_arena_webpage(team_id: int) -> str:
+@router.post("/update-pricing-from-arena-batch", response_model=ArenaBatchUpdateResponse)
+async def update_pricing_from_arena_webpages(request: ArenaBatchUpdateRequest) -> ArenaBatchUpdateResponse:
+    """
+    Update game pricing from the arena webpages of several teams concurrently.
+    
+    Up to max_concurrency teams are fetched and parsed at once, so network latency
+    of one team overlaps with the others. Failures are reported per team instead
+    of aborting the batch.
+    
+    Args:
+        request: Contains the team_ids to update and the concurrency cap
+        
+    Returns:
+        Per-team summaries for successful updates and errors for failed teams
+    """
+    db_manager = DatabaseManager("bb_arena_data.db")
+    max_concurrency = request.max_concurrency
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Be respectful to the server: all slots share one schedule with a fixed gap
+    # between fetch starts, whatever the concurrency
+    spacer = _RequestSpacer(_ARENA_REQUEST_DELAY)
+    
+    async def update_team(team_id: int) -> ArenaUpdateResponse:
+        async with semaphore:
+            await spacer.wait()
+            return await _update_team_pricing_from_arena(team_id, db_manager)
+    
+    logger.info(f"🔄 Starting arena pricing update for {len(request.team_ids)} teams "
+               f"(max {max_concurrency} concurrent)")
+    
+    team_ids = list(dict.fromkeys(request.team_ids))
+    outcomes = await asyncio.gather(*(update_team(team_id) for team_id in team_ids), return_exceptions=True)
+    
+    results: list[ArenaUpdateResponse] = []
+    failed_teams: Dict[int, str] = {}
+    for team_id, outcome in zip(team_ids, outcomes, strict=True):
+        if isinstance(outcome, ArenaUpdateResponse):
+            results.append(outcome)
+        elif isinstance(outcome, HTTPException):
+            failed_teams[team_id] = str(outcome.detail)
+        else:
+            logger.error(f"❌ Error updating arena pricing for team {team_id}: {outcome}")
+            failed_teams[team_id] = str(outcome)
+    
+    logger.info(f"🎉 Batch arena pricing update completed: {len(results)} succeeded, "
+               f"{len(failed_teams)} failed")
+    
+    return ArenaBatchUpdateResponse(
+        message=f"Updated arena pricing for {len(results)} of {len(team_ids)} teams",
+        results=results,
+        failed_teams=failed_teams
+    )
+
+
+async def _update_team_pricing_from_arena(team_id: int, db_manager: DatabaseManager) -> ArenaUpdateResponse:
+    """
+    Fetch and parse one team's arena webpage and apply its price periods to games.
+    
+    Args:
+        team_id: The BuzzerBeater team ID
+        db_manager: Database manager used to look up and update games
+        
+    Returns:
+        Summary of the update operation
+        
+    Raises:
+        HTTPException: If the arena table is missing or empty
+        requests.RequestException: If the webpage cannot be fetched
+    """
+    logger.info(f"🔄 Starting arena pricing update for team {team_id}")
+    
+    # Fetch arena webpage
+    logger.info(f"📥 Fetching arena webpage for team {team_id}")
+    # The fetch is blocking, so run it off the event loop to let other teams proceed
+    html_content = await asyncio.to_thread(_fetch_arena_webpage, team_id)
+    
+    # Parsing one page takes milliseconds; a worker thread keeps it off the event loop
+    # without the startup and pickling costs of a process pool
+    logger.info("🔍 Parsing arena table from HTML")
+    arena_rows = await asyncio.to_thread(_parse_arena_rows, html_content)
+    
+    if arena_rows is None:
+        raise HTTPException(status_code=404, detail="Arena table not found on webpage")
+    
+    if not arena_rows:
+        raise HTTPException(status_code=404, detail="No arena data found in table")
+    
+    logger.info(f"📊 Found {len(arena_rows)} arena rows")
+    
+    # Detect timezone from HTML
+    timezone_str = get_bb_timezone_from_html(html_content)
+    logger.info(f"🌍 Detected timezone: {timezone_str}")
+    
+    # Create price periods
+    logger.info("🏗️ Creating price periods from arena data")
+    periods = build_price_periods_from_data(
+        arena_rows, 
+        db_manager, 
+        str(team_id), 
+        timezone_str
+    )
+    
+    logger.info(f"✅ Created {len(periods)} price periods")
+    
+    # Update game pricing for each period
+    total_games_updated = 0
+    for period in periods:
+        update_results = period.update_game_pricing()
+        games_updated = sum(1 for success in update_results.values() if success)
+        total_games_updated += games_updated
+        logger.info(f"💰 Updated pricing for {games_updated} games in period {period.period_id} "
+                   f"({period.safe_start.date()} - {period.safe_end.date()})")
+    
+    logger.info(f"🎉 Arena pricing update completed for team {team_id}. "
+               f"Created {len(periods)} periods, updated {total_games_updated} games")
+    
+    return ArenaUpdateResponse(
+        message="Arena pricing updated successfully",
+        team_id=team_id,
+        periods_created=len(periods),
+        games_updated=total_games_updated
+    )
+
+
+def _parse_arena_rows(html_content: str) -> list[GameEvent | PriceChange] | None:
+    """
+    Isolate the attendance table from arena HTML and parse its rows.
+    
+    Args:
+        html_content: HTML content of the arena page
+        
+    Returns:
+        Parsed arena rows in table order, or None if the table is missing
+    """
+    arena_table = ArenaTableIsolator.find_attendance_table(html_content)
+    if not arena_table:
+        return None
+    return ArenaRowParser.parse_data_rows(arena_table)
+
+
+def _arena_cache_path(team_id: int) -> Path | None:
+    """
+    Get the on-disk cache file for today's arena page of a team.
+    
+    Caching is opt-in: set BB_ARENA_CACHE_DIR to a directory to let reruns on the
+    same (UTC) day reuse pages instead of fetching them again.
+    
+    Args:
+        team_id: The BuzzerBeater team ID
+        
+    Returns:
+        Path of the gzip-compressed cache file, or None if caching is disabled
+    """
+    cache_dir = os.getenv("BB_ARENA_CACHE_DIR")
+    if not cache_dir:
+        return None
+    today = datetime.now(UTC).date().isoformat()
+    return Path(cache_dir) / f"{team_id}-{today}.html.gz"
+
+
+def _validators_path(page_path: Path) -> Path:
+    """Get the sidecar file holding the HTTP validators of a cached arena page."""
+    return page_path.with_suffix('').with_suffix('.json')
+
+
+def _latest_cached_page(team_id: int, cache_path: Path) -> Path | None:
+    """
+    Find the most recent earlier cached arena page of a team that can be revalidated.
+    
+    Args:
+        team_id: The BuzzerBeater team ID
+        cache_path: Today's cache file for the team
+        
+    Returns:
+        Path of the newest older page that has stored validators, or None
+    """
+    # ISO dates in the file names sort chronologically
+    earlier_pages = sorted(
+        path for path in cache_path.parent.glob(f"{team_id}-*.html.gz") if path != cache_path
+    )
+    for page_path in reversed(earlier_pages):
+        if _validators_path(page_path).exists():
+            return page_path
+    return None
+
+
+def _fetch_arena_webpage(team_id: int, use_cache: bool = True) -> str:
     """
     Fetch the arena webpage HTML for a given team.
     
+    With the on-disk cache enabled, an older cached page is revalidated with a
+    conditional GET when the server sent ETag or Last-Modified for it; a
+    304 Not Modified answer reuses that page instead of downloading it again.
+    
     Args:
         team_id: The BuzzerBeater team ID
+        use_cache: Whether to read and write the optional on-disk page cache
         
     Returns:
         HTML content of the arena page
@@ -121,24 +324,48 @@ def _fetch_arena_webpage(team_id: int) -> str:
     Raises:
         requests.RequestException: If the request fails
     """
-    url = f"https://www.buzzerbeater.com/team/{team_id}/arena.aspx"
+    cache_path = _arena_cache_path(team_id) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        logger.debug(f"📦 Using cached arena webpage {cache_path}")
+        return gzip.decompress(cache_path.read_bytes()).decode('utf-8')
+    
+    previous_page = None
+    conditional_headers: Dict[str, str] = {}
+    if cache_path is not None and cache_path.parent.exists():
+        previous_page = _latest_cached_page(team_id, cache_path)
+        if previous_page is not None:
+            validators = json.loads(_validators_path(previous_page).read_text())
+            for response_header, request_header in _VALIDATOR_HEADERS:
+                if validators.get(response_header):
+                    conditional_headers[request_header] = validators[response_header]
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+    url = f"https://www.buzzerbeater.com/team/{team_id}/arena.aspx"
     
     logger.debug(f"🌐 Making request to {url}")
     
-    response = requests.get(url, headers=headers, timeout=30)
+    response = _arena_session.get(url, timeout=30, headers=conditional_headers)
     response.raise_for_status()
     
+    if response.status_code == 304 and cache_path is not None and previous_page is not None:
+        logger.debug(f"📦 Arena webpage not modified, reusing {previous_page}")
+        # Carry the page forward to today so later calls hit the cache directly
+        _validators_path(previous_page).rename(_validators_path(cache_path))
+        previous_page.rename(cache_path)
+        return gzip.decompress(cache_path.read_bytes()).decode('utf-8')
+    
     logger.debug(f"✅ Successfully fetched arena webpage (status: {response.status_code})")
     
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(gzip.compress(response.text.encode('utf-8')))
+        validators = {
+            response_header: response.headers[response_header]
+            for response_header, _ in _VALIDATOR_HEADERS
+            if response_header in response.headers
+        }
+        if validators:
+            _validators_path(cache_path).write_text(json.dumps(validators))
+    
     return response.text
 
 # CLI functionality
@@ -151,7 +378,6 @@ def fetch_and_save_arena_html(team_id: int, output_dir: str | None = None) -> No
         output_dir: Optional output directory (defaults to tests/collecting/fixtures)
     """
     import sys
-    import time
     from pathlib import Path
     from bs4 import Tag
     
@@ -174,12 +400,16 @@ def fetch_and_save_arena_html(team_id: int, output_dir: str | None = None) -> No
         time.sleep(1)
         
         # Fetch the HTML
-        html_content = _fetch_arena_webpage(team_id)
+        # Fixtures should always reflect the live page, so bypass the cache
+        html_content = _fetch_arena_webpage(team_id, use_cache=False)
         
         print(f"Successfully fetched {len(html_content)} characters")
         
         # Parse with BeautifulSoup to pretty-print and validate
-        soup = BeautifulSoup(html_content, 'html.parser')
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html_content, 'html.parser')
         pretty_html = str(soup)
         
         # Ensure output directory exists
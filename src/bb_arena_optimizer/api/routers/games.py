@@ -3,7 +3,9 @@
 import logging
 import os
 import traceback
+from bisect import bisect_left
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, List
 
 from fastapi import APIRouter, HTTPException
@@ -12,6 +14,7 @@ from dotenv import load_dotenv
 from ...storage.database import DatabaseManager
 from ...storage.models import GameRecord
 from ...api.client import BuzzerBeaterAPI
+from ...collecting.season_lookup import build_season_ranges, parse_game_date, resolve_season
 
 # Load environment variables
 load_dotenv()
@@ -37,21 +40,15 @@ def get_season_from_date(game_date_str: str, db_manager) -> int | None:
         
     try:
         # Parse the game date
-        if game_date_str.endswith('Z'):
-            parsed_game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-        else:
-            parsed_game_date = datetime.fromisoformat(game_date_str)
+        parsed_game_date = parse_game_date(game_date_str)
         
-        # Get all seasons from database to find which season this game belongs to
-        all_seasons = db_manager.get_all_seasons()
-        for season in all_seasons:
-            if season.start_date and season.end_date:
-                if season.start_date <= parsed_game_date <= season.end_date:
-                    return season.season_number
-            elif season.start_date and not season.end_date:
-                # Current season with no end date
-                if season.start_date <= parsed_game_date:
-                    return season.season_number
+        # Get all seasons from database and binary search the one containing this game,
+        # instead of comparing the date against every season in turn
+        season_ranges = build_season_ranges(db_manager.get_all_seasons())
+        season_starts = [start for start, _, _ in season_ranges]
+        season_number = resolve_season(parsed_game_date, season_ranges, season_starts)
+        if season_number is not None:
+            return season_number
                     
         logger.warning(f"Could not determine season for date {parsed_game_date}")
         return None
@@ -158,10 +155,9 @@ async def check_games_stored(team_id: int, game_ids: List[str]):
     """Check which games from a list are already stored in the database."""
     try:
         db_manager = DatabaseManager("bb_arena_data.db")
-        stored_games = {}
-        for game_id in game_ids:
-            game = db_manager.get_game_by_id(game_id)
-            stored_games[game_id] = game is not None
+        # One lookup for all IDs instead of loading each game record separately
+        stored_ids = db_manager.get_stored_game_ids(game_ids)
+        stored_games = {game_id: game_id in stored_ids for game_id in game_ids}
         
         return {"stored_games": stored_games}
         
@@ -209,7 +205,7 @@ async def get_prefix_max_attendance(team_id: int, up_to_date: str):
     try:
         # Validate date format
         try:
-            datetime.fromisoformat(up_to_date.replace('Z', '+00:00'))
+            cutoff_date = datetime.fromisoformat(up_to_date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)")
         
@@ -218,11 +214,18 @@ async def get_prefix_max_attendance(team_id: int, up_to_date: str):
         
         # Also get total count of games used for this calculation
         games = db_manager.get_games_for_team(str(team_id), limit=10000)
+        # Sort once by naive date and bisect to the cutoff so games after it are never inspected;
+        # the rows already arrive date-ordered, so the sort is close to linear
+        cutoff = cutoff_date.replace(tzinfo=None)
+        dated_games = sorted(
+            ((game.date.replace(tzinfo=None), game) for game in games if game.date),
+            key=itemgetter(0)
+        )
+        candidates = dated_games[:bisect_left(dated_games, cutoff, key=itemgetter(0))]
+        # Both IDs are ints, so compare them directly instead of formatting two strings per game
         home_games_before_date = [
-            game for game in games 
-            if str(game.home_team_id) == str(team_id) 
-            and game.date 
-            and game.date.isoformat() < up_to_date
+            game for _, game in candidates 
+            if game.home_team_id == team_id 
             and game.total_attendance is not None
             and not game.neutral_arena
         ]
@@ -345,20 +348,15 @@ async def update_team_scores_from_schedule(team_id: int, season: int | None = No
                     detail=f"No schedule found for team {team_id}"
                 )
             
-            # Get home games from database that are missing scores
-            stored_games = db_manager.get_games_for_team(str(team_id))
-            games_needing_scores = [
-                game for game in stored_games 
-                if (game.score_home is None or game.score_away is None) and
-                   game.home_team_id == team_id and  # Only home games for this team
-                   not game.neutral_arena  # Exclude neutral venue games
-            ]
-            
-            updated_count = 0
+            # Get home games from database that are missing scores; scored games are
+            # filtered out in SQL, so they are never turned into records
+            games_needing_scores = db_manager.get_home_games_missing_scores(team_id)
             
             # Create a lookup of schedule matches by game_id
             schedule_lookup = {str(match["match_id"]): match for match in schedule_data["matches"]}
             
+            # Collect the scored games and save them together in one transaction
+            games_to_save: List[GameRecord] = []
             for game in games_needing_scores:
                 if game.game_id in schedule_lookup:
                     schedule_match = schedule_lookup[game.game_id]
@@ -366,10 +364,11 @@ async def update_team_scores_from_schedule(team_id: int, season: int | None = No
                     # Only update if schedule has scores
                     if schedule_match["home_score"] is not None and schedule_match["away_score"] is not None:
                         game.update_scores_from_schedule(schedule_match)
-                        db_manager.save_game_record(game)
-                        updated_count += 1
+                        games_to_save.append(game)
                         logger.info(f"Updated scores for game {game.game_id}: {schedule_match['home_score']} - {schedule_match['away_score']}")
             
+            updated_count = db_manager.save_game_records(games_to_save)
+            
             return {
                 "team_id": team_id,
                 "season": season,
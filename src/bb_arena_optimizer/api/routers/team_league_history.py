@@ -79,8 +79,8 @@ async def get_team_league_history(team_id: str, active_only: bool = False):
         
         # Calculate counts
         all_entries = db_manager.get_team_league_history(team_id_int, active_only=False)
-        active_count = len([e for e in all_entries if e.is_active_team])
-        predecessor_count = len([e for e in all_entries if not e.is_active_team])
+        active_count = sum(1 for e in all_entries if e.is_active_team)
+        predecessor_count = len(all_entries) - active_count
         
         return TeamLeagueHistoryListResponse(
             history=history_responses,
@@ -109,12 +109,13 @@ async def collect_team_league_history(team_id: str):
         if success:
             # Get the collected data for the response
             history_entries = db_manager.get_team_league_history(team_id_int, active_only=False)
+            active_entries = sum(1 for e in history_entries if e.is_active_team)
             return {
                 "success": True,
                 "message": f"Successfully collected {len(history_entries)} league history entries",
                 "total_entries": len(history_entries),
-                "active_entries": len([e for e in history_entries if e.is_active_team]),
-                "predecessor_entries": len([e for e in history_entries if not e.is_active_team])
+                "active_entries": active_entries,
+                "predecessor_entries": len(history_entries) - active_entries
             }
         else:
             raise HTTPException(status_code=400, detail="Failed to collect team league history")
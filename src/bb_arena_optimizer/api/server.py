@@ -1,6 +1,7 @@
 """FastAPI server for serving arena data from the database."""
 
 import logging
+import sqlite3
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,7 +22,6 @@ db_manager = DatabaseManager("bb_arena_data.db")
 def check_level_1_leagues():
     """Check if the level 1 leagues table is populated, and populate it if empty."""
     try:
-        import sqlite3
         with sqlite3.connect("bb_arena_data.db") as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM league_hierarchy WHERE league_level = 1")
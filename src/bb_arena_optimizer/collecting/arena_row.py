@@ -21,7 +21,39 @@ from typing import Optional, List, Union
 import re
 
 
-@dataclass
+# Number of td cells in every game and price change row
+_DATA_ROW_CELLS = 8
+
+# Extracts the game ID from a match link href
+_MATCH_HREF_RE = re.compile(r'/match/(\d++)/')
+
+
+def _safe_int(text: str) -> Optional[int]:
+    """Parse a cell's integer value; int() already ignores surrounding whitespace."""
+    # Blank cells are answered without raising and catching ValueError
+    if not text or text.isspace():
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _game_id_from_href(href: Optional[str]) -> Optional[str]:
+    """Extract the game ID from a match link href, if it is one."""
+    if not href:
+        return None
+    match = _MATCH_HREF_RE.search(href)
+    return match.group(1) if match else None
+
+
+def _is_price_change(opponent_text: str, attendance_text: Optional[str]) -> bool:
+    """Classify a row from its opponent and total attendance cell texts."""
+    # A substring test needs no strip; the attendance text is compared stripped
+    return 'Ticket Price Update' in opponent_text or attendance_text == '-1'
+
+
+@dataclass(slots=True)
 class GameEvent:
     """Represents a game record from the arena table."""
     
@@ -33,28 +65,24 @@ class GameEvent:
     date_raw: str  # Original date string from HTML in the timezone of the HTTP request origin
     
     @classmethod
-    def from_table_row(cls, row: Tag, row_index: int) -> 'GameEvent':
-        """Create GameEvent object from a table row."""
-        cells = row.find_all('td')
-        if len(cells) < 8:
+    def from_table_row(cls, row: Tag, row_index: int, cells: Optional[List[Tag]] = None) -> 'GameEvent':
+        """Create GameEvent object from a table row, reusing already extracted cells if given."""
+        if cells is None:
+            cells = row.find_all('td')
+        if len(cells) < _DATA_ROW_CELLS:
             raise ValueError(f"Game row must have 8 cells, got {len(cells)}")
         
-        # Extract game ID from date link
-        game_id = None
-        if isinstance(cells[0], Tag):
-            date_link = cells[0].find('a')
-            if isinstance(date_link, Tag) and date_link.get('href'):
-                href = date_link.get('href')
-                if href and isinstance(href, str):
-                    match = re.search(r'/match/(\d+)/', href)
-                    if match:
-                        game_id = match.group(1)
+        # Extract game ID from date link; cells come from find_all('td') and are always
+        # Tags, so only the link lookup needs narrowing, and its href is read once
+        date_link = cells[0].find('a')
+        href = date_link.get('href') if isinstance(date_link, Tag) else None
+        game_id = _game_id_from_href(href) if isinstance(href, str) else None
         
         if game_id is None:
             raise ValueError("Game ID is mandatory but could not be extracted")
         
         # Get date string
-        date_raw = cells[0].get_text().strip()
+        date_raw = cells[0].get_text(strip=True)
         
         return cls(
             row_index=row_index,
@@ -63,7 +91,7 @@ class GameEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceChange:
     """Represents a ticket price update record from the arena table."""
     
@@ -80,26 +108,21 @@ class PriceChange:
     luxury_boxes_price: Optional[int]
     
     @classmethod
-    def from_table_row(cls, row: Tag, row_index: int) -> 'PriceChange':
-        """Create PriceChange object from a table row."""
-        cells = row.find_all('td')
-        if len(cells) < 8:
+    def from_table_row(cls, row: Tag, row_index: int, cells: Optional[List[Tag]] = None) -> 'PriceChange':
+        """Create PriceChange object from a table row, reusing already extracted cells if given."""
+        if cells is None:
+            cells = row.find_all('td')
+        if len(cells) < _DATA_ROW_CELLS:
             raise ValueError(f"Price change row must have 8 cells, got {len(cells)}")
         
         # Get date string
-        date_raw = cells[0].get_text().strip()
+        date_raw = cells[0].get_text(strip=True)
         
         # Parse price values (these are in the attendance columns for price updates)
-        def safe_int(text: str) -> Optional[int]:
-            try:
-                return int(text.strip())
-            except (ValueError, AttributeError):
-                return None
-        
-        bleachers_price = safe_int(cells[2].get_text())
-        lower_tier_price = safe_int(cells[3].get_text())
-        courtside_price = safe_int(cells[4].get_text())
-        luxury_boxes_price = safe_int(cells[5].get_text())
+        bleachers_price = _safe_int(cells[2].get_text())
+        lower_tier_price = _safe_int(cells[3].get_text())
+        courtside_price = _safe_int(cells[4].get_text())
+        luxury_boxes_price = _safe_int(cells[5].get_text())
         
         return cls(
             row_index=row_index,
@@ -115,32 +138,25 @@ class ArenaRowParser:
     """Service for parsing attendance table rows into structured objects."""
     
     @staticmethod
-    def is_price_change_row(row: Tag) -> bool:
+    def is_price_change_row(row: Tag, cells: Optional[List[Tag]] = None) -> bool:
         """
         Determine if a table row represents a price change.
         
         Args:
             row: BeautifulSoup table row Tag
+            cells: The row's td cells, if already extracted
             
         Returns:
             True if this is a price change row
         """
-        cells = row.find_all('td')
+        if cells is None:
+            cells = row.find_all('td')
         if len(cells) < 2:
             return False
         
-        # Check if opponent cell contains "Ticket Price Update"
-        opponent_text = cells[1].get_text().strip()
-        if 'Ticket Price Update' in opponent_text:
-            return True
-        
-        # Alternative check: total attendance is -1
-        if len(cells) >= 7:
-            attendance_text = cells[6].get_text().strip()
-            if attendance_text == '-1':
-                return True
-        
-        return False
+        # Price changes say "Ticket Price Update" as opponent or have a total attendance of -1
+        attendance_text = cells[6].get_text(strip=True) if len(cells) >= 7 else None
+        return _is_price_change(cells[1].get_text(), attendance_text)
     
     @staticmethod
     def parse_data_rows(table: Tag) -> List[Union[GameEvent, PriceChange]]:
@@ -159,17 +175,27 @@ class ArenaRowParser:
         
         for row in all_rows:
             if isinstance(row, Tag):
-                # Skip header row
-                row_class = row.get('class')
-                if row_class and 'tableHeader' in str(row_class):
+                # Skip header row; class is a multi-valued attribute, so test list membership
+                # instead of stringifying the list for every row
+                if 'tableHeader' in (row.get('class') or ()):
+                    continue
+                
+                # Extract the cells once; classification and parsing both need them
+                cells = row.find_all('td')
+                
+                # Quick reject: neither row type can be built from fewer cells, so skip
+                # classification and the exception raised by from_table_row
+                if len(cells) < _DATA_ROW_CELLS:
+                    print(f"Warning: Failed to parse row {row_index}: expected {_DATA_ROW_CELLS} cells, got {len(cells)}")
+                    row_index += 1
                     continue
                 
                 try:
-                    if ArenaRowParser.is_price_change_row(row):
-                        price_change = PriceChange.from_table_row(row, row_index)
+                    if ArenaRowParser.is_price_change_row(row, cells):
+                        price_change = PriceChange.from_table_row(row, row_index, cells)
                         parsed_objects.append(price_change)
                     else:
-                        game_event = GameEvent.from_table_row(row, row_index)
+                        game_event = GameEvent.from_table_row(row, row_index, cells)
                         parsed_objects.append(game_event)
 
                     row_index += 1
@@ -1,7 +1,51 @@
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
 from typing import Optional
 
 
+# Column headers of the attendance table, in order
+_EXPECTED_HEADERS = (
+    'Date', 'Opponent', 'Bleachers', 'Lower Tier',
+    'Courtside Seats', 'Luxury Boxes', 'Total Attendance', 'Game Type'
+)
+
+# Only the attendance table is needed, so the rest of the page is never turned into a tree
+_ATTENDANCE_TABLE_ONLY = SoupStrainer('table', id='cphContent_seatingStats')
+
+
+def _slice_attendance_table(html_content: str) -> Optional[str]:
+    """
+    Cut the attendance table's markup out of the page without parsing it.
+    
+    Args:
+        html_content: Full HTML content of arena page
+        
+    Returns:
+        The markup from the table's opening tag to its closing tag, or None if
+        it cannot be isolated safely (e.g. the table contains nested tables)
+    """
+    id_pos = html_content.find('cphContent_seatingStats')
+    start = html_content.rfind('<table', 0, id_pos)
+    end = html_content.find('</table>', id_pos)
+    if id_pos < 0 or start < 0 or end < 0:
+        return None
+    
+    # A nested table would end the slice at the inner closing tag
+    if html_content.find('<table', start + 1, end) >= 0:
+        return None
+    return html_content[start:end + len('</table>')]
+
+
+def _parse_attendance_table(html_content: str) -> Optional[Tag]:
+    """Parse HTML and return the attendance table Tag, if present."""
+    try:
+        # lxml's C parser is much faster than the pure-Python html.parser
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=_ATTENDANCE_TABLE_ONLY)
+    except FeatureNotFound:
+        soup = BeautifulSoup(html_content, 'html.parser', parse_only=_ATTENDANCE_TABLE_ONLY)
+    table = soup.find('table', id='cphContent_seatingStats')
+    return table if isinstance(table, Tag) else None
+
+
 class ArenaTableIsolator:
     """Service for isolating the attendance table from arena HTML."""
     
@@ -16,9 +60,17 @@ class ArenaTableIsolator:
         Returns:
             BeautifulSoup Tag object of the table, or None if not found
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        table = soup.find('table', id='cphContent_seatingStats')
-        return table if isinstance(table, Tag) else None
+        # A plain substring check is far cheaper than parsing a page that has no table
+        if 'cphContent_seatingStats' not in html_content:
+            return None
+        
+        # Parse just the table's markup when it can be cut out of the page; fall back
+        # to the whole page if the cut-out does not yield the table
+        table_html = _slice_attendance_table(html_content)
+        table = _parse_attendance_table(table_html) if table_html is not None else None
+        if table is None:
+            table = _parse_attendance_table(html_content)
+        return table
     
     @staticmethod
     def validate_table_structure(table: Tag) -> bool:
@@ -36,14 +88,9 @@ class ArenaTableIsolator:
         if not header_row or not isinstance(header_row, Tag):
             return False
         
-        # Check headers
-        expected_headers = [
-            'Date', 'Opponent', 'Bleachers', 'Lower Tier', 
-            'Courtside Seats', 'Luxury Boxes', 'Total Attendance', 'Game Type'
-        ]
-        
-        headers = [th.get_text().strip() for th in header_row.find_all('th')]
-        return headers == expected_headers
+        # Compare all header cells against the expected columns in one tuple comparison
+        headers = tuple(th.get_text(strip=True) for th in header_row.find_all('th'))
+        return headers == _EXPECTED_HEADERS
     
     @staticmethod
     def count_data_rows(table: Tag) -> int:
@@ -56,14 +103,8 @@ class ArenaTableIsolator:
         Returns:
             Number of data rows
         """
-        all_rows = table.find_all('tr')
-        data_rows = []
-        
-        for row in all_rows:
-            if isinstance(row, Tag):
-                row_class = row.get('class')
-                # Skip header rows
-                if row_class is None or 'tableHeader' not in str(row_class):
-                    data_rows.append(row)
-        
-        return len(data_rows)
\ No newline at end of file
+        # Count in one pass without collecting the rows; header rows are skipped
+        return sum(
+            1 for row in table.find_all('tr')
+            if isinstance(row, Tag) and 'tableHeader' not in (row.get('class') or ())
+        )
\ No newline at end of file
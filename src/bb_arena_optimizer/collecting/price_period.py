@@ -22,6 +22,7 @@ Key Components:
 - PricePeriodBuilder: Service for creating periods from game event and price data
 """
 
+from bisect import bisect_left
 from datetime import datetime, UTC as datetime_utc
 from dataclasses import dataclass, field
 from typing import List, Optional, Union, Set
@@ -60,18 +61,18 @@ def validate_games_in_database(game_events: List[GameEvent], db_manager: Databas
     """
     missing_games = []
 
+    # Check every game against the database with one lookup instead of a connection
+    # and query per game (use the original string game_ids)
+    stored_game_ids = db_manager.get_stored_game_ids([game.game_id for game in game_events])
+
     for game in game_events:
         # Convert game_id to int if it's a string for validation
         try:
             game_id_int = int(game.game_id) if isinstance(game.game_id, str) else game.game_id
             if not isinstance(game_id_int, int) or game_id_int <= 0:
                 missing_games.append(f"Row {game.row_index}: invalid game_id {game.game_id}")
-            else:
-                # Query database to check if game exists (use original string game_id)
-                try:
-                    db_manager.get_game_start_time_UTC(game.game_id)
-                except ValueError:
-                    missing_games.append(f"Row {game.row_index}: game_id {game.game_id} not found in database")
+            elif game.game_id not in stored_game_ids:
+                missing_games.append(f"Row {game.row_index}: game_id {game.game_id} not found in database")
         except (ValueError, TypeError):
             missing_games.append(f"Row {game.row_index}: invalid game_id format {game.game_id}")
     
@@ -195,21 +196,17 @@ class PricePeriod:
             start_time = self.safe_start
             end_time = self.safe_end
             
-            # Query database for games in time range
-            candidate_games = self.db_manager.get_team_games_in_time_range(
+            # Query database for games in time range, letting the query leave out
+            # games that are already in game_events
+            existing_game_ids = frozenset(game.game_id for game in self.game_events)
+            return self.db_manager.get_team_games_in_time_range(
                 team_id=self.home_team_id,
                 start_time=start_time,
                 end_time=end_time,
-                home_games_only=True
+                home_games_only=True,
+                exclude_game_ids=existing_game_ids
             )
             
-            # Filter out games that are already in game_events
-            existing_game_ids = {game.game_id for game in self.game_events}
-            other_games = [game for game in candidate_games 
-                          if game.game_id not in existing_game_ids]
-            
-            return other_games
-            
         except Exception:
             # If query fails, return empty list
             return []
@@ -313,30 +310,24 @@ class PricePeriod:
             )
             return results
         
+        # Per-game success lines are debug detail next to the summary below; check the
+        # level once so the messages are not formatted per game when they would be dropped
+        log_each_game = logger.isEnabledFor(logging.DEBUG)
+        
         # Update pricing for game_events (from arena table scraping)
         for game_event in self.game_events:
             try:
-                # Get the game record from database
-                game_record = self.db_manager.get_game_by_id(game_event.game_id)
-                if not game_record:
-                    logger.warning(f"Game {game_event.game_id} not found in database")
-                    results[game_event.game_id] = False
-                    continue
-                
-                # Update pricing fields
-                game_record.bleachers_price = pricing_data.get("bleachers_price")
-                game_record.lower_tier_price = pricing_data.get("lower_tier_price")
-                game_record.courtside_price = pricing_data.get("courtside_price")
-                game_record.luxury_boxes_price = pricing_data.get("luxury_boxes_price")
-                
-                # Save to database
-                success = self.db_manager.update_game_prices(game_record)
+                # Write the prices directly; loading and rebuilding the full game record
+                # only to change four columns is unnecessary, and a missing game shows
+                # up as no updated row
+                success = self.db_manager.update_game_prices_by_id(game_event.game_id, pricing_data)
                 results[game_event.game_id] = success
                 
                 if success:
-                    logger.info(f"Updated pricing for game {game_event.game_id} in period {self.period_id}")
+                    if log_each_game:
+                        logger.debug(f"Updated pricing for game {game_event.game_id} in period {self.period_id}")
                 else:
-                    logger.warning(f"Failed to update pricing for game {game_event.game_id}")
+                    logger.warning(f"Game {game_event.game_id} not found in database; pricing not updated")
                     
             except Exception as e:
                 logger.error(f"Error updating pricing for game {game_event.game_id}: {e}")
@@ -356,7 +347,8 @@ class PricePeriod:
                 results[game_record.game_id] = success
                 
                 if success:
-                    logger.info(f"Updated pricing for database game {game_record.game_id} in period {self.period_id}")
+                    if log_each_game:
+                        logger.debug(f"Updated pricing for database game {game_record.game_id} in period {self.period_id}")
                 else:
                     logger.warning(f"Failed to update pricing for database game {game_record.game_id}")
                     
@@ -422,8 +414,7 @@ class PricePeriodBuilder:
         else:
             # Ensure request_time is timezone-aware
             if request_time.tzinfo is None:
-                from datetime import timezone as tz
-                self.request_time = request_time.replace(tzinfo=tz.utc)
+                self.request_time = request_time.replace(tzinfo=datetime_utc)
             else:
                 self.request_time = request_time
     
@@ -506,9 +497,14 @@ class PricePeriodBuilder:
         price_change: PriceChange,
     ) -> List[PricePeriod]:
         """Build two periods when there is exactly one price change."""
-        # Split games by price change row index
-        period1_games = [g for g in games if g.row_index > price_change.row_index]
-        period2_games = [g for g in games if g.row_index < price_change.row_index]
+        # Split games by price change row index in one pass
+        period1_games: List[GameEvent] = []
+        period2_games: List[GameEvent] = []
+        for g in games:
+            if g.row_index > price_change.row_index:
+                period1_games.append(g)
+            elif g.row_index < price_change.row_index:
+                period2_games.append(g)
         
         periods: List[PricePeriod] = []
         
@@ -569,13 +565,22 @@ class PricePeriodBuilder:
         # Sort price changes by row index (chronological, oldest first)
         sorted_price_changes = sorted(price_changes, key=lambda x: x.row_index, reverse=True)
         
+        # Bucket games by the price changes around them in one pass instead of
+        # rescanning all games per price change. Bucket 0 holds games before the
+        # first price change and bucket i + 1 the games after price change i.
+        ascending_rows = [pc.row_index for pc in reversed(sorted_price_changes)]
+        games_by_period: List[List[GameEvent]] = [[] for _ in range(len(sorted_price_changes) + 1)]
+        for g in games:
+            later_changes = bisect_left(ascending_rows, g.row_index)
+            games_by_period[len(ascending_rows) - later_changes].append(g)
+        
         # Create periods in chronological order
         
         for i, price_change in enumerate(sorted_price_changes):
             
             if i == 0:
                 # First period: from start to first price change
-                period_games = [g for g in games if g.row_index > price_change.row_index]
+                period_games = games_by_period[0]
                 # Only add period if it has games
                 if not period_games:
                     logger.warning(
@@ -606,12 +611,10 @@ class PricePeriodBuilder:
             if i == len(sorted_price_changes) - 1:
                 # Last price change period: to final end time
                 next_price_change = None
-                period_games = [g for g in games if g.row_index < price_change.row_index]
             else:
                 # Middle period: to next price change
                 next_price_change = sorted_price_changes[i + 1]
-                period_games = [g for g in games 
-                              if next_price_change.row_index < g.row_index < price_change.row_index]
+            period_games = games_by_period[i + 1]
             
             # Skip creating meaningless periods (no games and same date price changes)
             if (not period_games and 
@@ -659,9 +662,14 @@ def build_price_periods_from_data(
     Returns:
         List of PricePeriod objects in chronological order
     """
-    # Separate games and price changes
-    games = [obj for obj in all_objects if isinstance(obj, GameEvent)]
-    price_changes = [obj for obj in all_objects if isinstance(obj, PriceChange)]
+    # Separate games and price changes in a single pass
+    games: List[GameEvent] = []
+    price_changes: List[PriceChange] = []
+    for obj in all_objects:
+        if isinstance(obj, GameEvent):
+            games.append(obj)
+        elif isinstance(obj, PriceChange):
+            price_changes.append(obj)
     
     # Build periods
     builder = PricePeriodBuilder(db_manager, home_team_id, timezone_str, request_time)
@@ -0,0 +1,88 @@
+"""
+Season Lookup Helpers
+
+This module maps game dates to season numbers. The functions are pure (no database
+or network access) and strictly typed so they can be unit tested in isolation and
+compiled ahead of time if the lookup ever shows up in profiles.
+
+Key Components:
+- parse_game_date: Parse an ISO game date string, caching repeated start times
+- utc_timestamp: Convert a datetime to a POSIX timestamp, treating naive values as UTC
+- build_season_ranges: Turn Season records into sorted timestamp ranges
+- resolve_season: Find the season containing a given date via binary search
+"""
+
+import math
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from functools import lru_cache
+
+from ..storage.models import Season
+
+# (start_timestamp, end_timestamp, season_number); the current season ends at infinity
+SeasonRange = tuple[float, float, int]
+
+
+@lru_cache(maxsize=4096)
+def parse_game_date(value: str) -> datetime:
+    """
+    Parse an ISO game date string such as '2025-01-04T18:00:00Z'.
+
+    fromisoformat accepts the trailing 'Z' since Python 3.11, so the string is parsed
+    as is. Results are cached because many schedule games share the same start time.
+    """
+    return datetime.fromisoformat(value)
+
+
+def utc_timestamp(value: datetime) -> float:
+    """Get the POSIX timestamp of a datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def build_season_ranges(seasons: Iterable[Season]) -> list[SeasonRange]:
+    """
+    Build sorted season timestamp ranges from Season records.
+
+    Args:
+        seasons: Season records; entries without a start date or number are ignored
+
+    Returns:
+        List of (start_timestamp, end_timestamp, season_number) tuples sorted by start.
+        A season without an end date gets an infinite end timestamp.
+    """
+    ranges: list[SeasonRange] = []
+    for season in seasons:
+        if not season.start_date or season.season_number is None:
+            continue
+        end_ts = utc_timestamp(season.end_date) if season.end_date else math.inf
+        ranges.append((utc_timestamp(season.start_date), end_ts, season.season_number))
+    ranges.sort()
+    return ranges
+
+
+def resolve_season(
+    game_date: datetime,
+    season_ranges: list[SeasonRange],
+    season_starts: list[float]
+) -> int | None:
+    """
+    Find the season a game date falls in.
+
+    Args:
+        game_date: Date of the game
+        season_ranges: Ranges as returned by build_season_ranges
+        season_starts: Start timestamps of season_ranges, in the same order
+
+    Returns:
+        Season number if the date lies within a season, None otherwise
+    """
+    game_ts = utc_timestamp(game_date)
+
+    # Latest season starting at or before the game; it must also not have ended
+    index = bisect_right(season_starts, game_ts) - 1
+    if index >= 0 and game_ts <= season_ranges[index][1]:
+        return season_ranges[index][2]
+    return None
@@ -8,21 +8,41 @@ and can be executed independently with proper dependency management.
 import asyncio
 import logging
 import time
+from collections import deque
+from contextlib import nullcontext
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Set, Optional, Any, Tuple, TypeVar, Generic
+from typing import Deque, Dict, List, Set, Optional, Any, Tuple, TypeVar, Generic
 from dataclasses import dataclass
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from ..api.client import BuzzerBeaterAPI
 from ..storage.database import DatabaseManager
 from ..storage.collector import DataCollectionService
+from ..storage.models import GameRecord, TeamInfo
+from .season_lookup import build_season_ranges, parse_game_date, resolve_season
 
 logger = logging.getLogger(__name__)
 
 
 T = TypeVar('T')
 
+# Alternative score fields that indicate a schedule entry has been played
+_SCORE_FIELDS = frozenset(('score', 'scores'))
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 @dataclass
 class TaskResult(Generic[T]):
     """Result of a task execution."""
@@ -40,6 +60,7 @@ class RateLimitConfig:
     requests_per_minute: int = 25
     min_delay_between_requests: float = 2.5
     max_delay_between_requests: float = 4.0
+    max_concurrent_requests: int = 4
     
     
 class TaskBasedCollector:
@@ -63,6 +84,26 @@ class TaskBasedCollector:
         # State tracking
         self.last_request_time = 0.0
         self.request_count = 0
+        self._request_times: Deque[float] = deque(maxlen=self.rate_config.requests_per_minute)
+        
+        # Serializes updates to the request timing state above
+        self._rate_limit_lock = asyncio.Lock()
+        
+        # Season ranges for game date lookups, loaded lazily from the database
+        self._season_ranges: List[Tuple[float, float, int]] = []
+        self._season_starts: List[float] = []
+        
+        # Bounds concurrent single-game collections across all teams
+        self._game_semaphore = asyncio.Semaphore(self.rate_config.max_concurrent_requests)
+        
+        # Bounds concurrent per-team API requests (team info and arena snapshots)
+        self._api_semaphore = asyncio.Semaphore(self.rate_config.max_concurrent_requests)
+        
+        # Bounds concurrent webpage scrapes (team history and arena pages)
+        self._webpage_semaphore = asyncio.Semaphore(self.rate_config.max_concurrent_requests)
+        
+        # Completion status per (game_id, season), reset at the start of task 5
+        self._completed_cache: Dict[Tuple[str, int], bool] = {}
         
     async def task_1_collect_team_ids(
         self,
@@ -82,7 +123,7 @@ class TaskBasedCollector:
         Returns:
             TaskResult with data containing set of team_ids
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = f"collect_team_ids_seasons_{'-'.join(map(str, seasons))}"
         
         logger.info(f"🎯 Task 1: Collecting team IDs from seasons {seasons}")
@@ -151,7 +192,7 @@ class TaskBasedCollector:
                     if leagues_processed % 10 == 0:
                         logger.info(f"   📈 Processed {leagues_processed} leagues, found {len(all_team_ids)} unique teams so far")
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             logger.info(f"✅ Task 1 completed!")
             logger.info(f"   - Processed {leagues_processed} leagues")
@@ -167,7 +208,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 1 failed: {e}")
             
             return TaskResult(
@@ -187,7 +228,7 @@ class TaskBasedCollector:
         Returns:
             TaskResult with summary of collection
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = "collect_team_info"
         
         logger.info(f"📋 Task 2: Collecting team info for {len(team_ids)} teams")
@@ -197,36 +238,18 @@ class TaskBasedCollector:
             failed_collections = 0
             failed_teams = []
             
-            for i, team_id in enumerate(team_ids, 1):
-                logger.debug(f"[{i}/{len(team_ids)}] Collecting team info for team {team_id}")
-                
-                try:
-                    # Get team info from API
-                    team_data = self.api.get_team_info(team_id)
-                    
-                    if team_data:
-                        # Create TeamInfo object and store in database
-                        from ..storage.models import TeamInfo
-                        
-                        # Use a generic username for mass collection (could be improved)
-                        username = f"fetched_for_{team_id}"
-                        team_info = TeamInfo.from_api_data(team_data, username)
-                        
-                        # Store in database
-                        self.db_manager.save_team_info(team_info)
-                        
-                        logger.debug(f"✅ Saved team info for {team_id}: {team_data.get('name', 'Unknown')}")
-                        successful_collections += 1
-                    else:
-                        logger.warning(f"❌ No team info returned for team {team_id}")
-                        failed_collections += 1
-                        failed_teams.append(team_id)
-                    
-                    # Rate limiting
-                    await self._respect_rate_limits()
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error collecting team info for team {team_id}: {e}")
+            # Fetch team info concurrently; the semaphore and the shared rate
+            # limiter bound how many requests are in flight
+            pending = [
+                asyncio.create_task(self._collect_team_info_bounded(team_id))
+                for team_id in team_ids
+            ]
+            
+            for i, future in enumerate(asyncio.as_completed(pending), 1):
+                team_id, success = await future
+                if success:
+                    successful_collections += 1
+                else:
                     failed_collections += 1
                     failed_teams.append(team_id)
                 
@@ -236,7 +259,7 @@ class TaskBasedCollector:
                     logger.info(f"   📈 Task 2 Progress: {progress:.1%} ({i}/{len(team_ids)}) - "
                                f"Success: {successful_collections}, Failed: {failed_collections}")
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             success_rate = successful_collections / len(team_ids) if team_ids else 0
             
             logger.info(f"✅ Task 2 completed!")
@@ -261,7 +284,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 2 failed: {e}")
             
             return TaskResult(
@@ -281,7 +304,7 @@ class TaskBasedCollector:
         Returns:
             TaskResult with summary of collection
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = "collect_arena_snapshots"
         
         logger.info(f"🏟️ Task 3: Collecting arena snapshots for {len(team_ids)} teams")
@@ -291,26 +314,18 @@ class TaskBasedCollector:
             failed_collections = 0
             failed_teams = []
             
-            for i, team_id in enumerate(team_ids, 1):
-                logger.debug(f"[{i}/{len(team_ids)}] Collecting arena data for team {team_id}")
-                
-                try:
-                    # Use the existing arena data collection method
-                    success = self.collector.collect_arena_data(self.api, str(team_id))
-                    
-                    if success:
-                        logger.debug(f"✅ Collected arena data for team {team_id}")
-                        successful_collections += 1
-                    else:
-                        logger.warning(f"❌ Failed to collect arena data for team {team_id}")
-                        failed_collections += 1
-                        failed_teams.append(team_id)
-                    
-                    # Rate limiting
-                    await self._respect_rate_limits()
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error collecting arena data for team {team_id}: {e}")
+            # Collect arena data concurrently; the semaphore and the shared rate
+            # limiter bound how many requests are in flight
+            pending = [
+                asyncio.create_task(self._collect_arena_data_bounded(team_id))
+                for team_id in team_ids
+            ]
+            
+            for i, future in enumerate(asyncio.as_completed(pending), 1):
+                team_id, success = await future
+                if success:
+                    successful_collections += 1
+                else:
                     failed_collections += 1
                     failed_teams.append(team_id)
                 
@@ -320,7 +335,7 @@ class TaskBasedCollector:
                     logger.info(f"   📈 Task 3 Progress: {progress:.1%} ({i}/{len(team_ids)}) - "
                                f"Success: {successful_collections}, Failed: {failed_collections}")
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             success_rate = successful_collections / len(team_ids) if team_ids else 0
             
             logger.info(f"✅ Task 3 completed!")
@@ -345,7 +360,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 3 failed: {e}")
             
             return TaskResult(
@@ -355,11 +370,73 @@ class TaskBasedCollector:
                 execution_time=execution_time
             )
     
+    async def _collect_team_info_bounded(self, team_id: int) -> Tuple[int, bool]:
+        """
+        Fetch and store one team's info while holding an API semaphore slot.
+        
+        Args:
+            team_id: Team ID to collect info for
+            
+        Returns:
+            Tuple of (team_id, success) so results can be consumed out of order
+        """
+        async with self._api_semaphore:
+            await self._respect_rate_limits()
+            
+            try:
+                # The API client is blocking, so run the request off the event loop
+                team_data = await asyncio.to_thread(self.api.get_team_info, team_id)
+                
+                if not team_data:
+                    logger.warning(f"❌ No team info returned for team {team_id}")
+                    return team_id, False
+                
+                # Create TeamInfo object and store in database
+                # Use a generic username for mass collection (could be improved)
+                username = f"fetched_for_{team_id}"
+                team_info = TeamInfo.from_api_data(team_data, username)
+                self.db_manager.save_team_info(team_info)
+                
+                logger.debug(f"✅ Saved team info for {team_id}: {team_data.get('name', 'Unknown')}")
+                return team_id, True
+                
+            except Exception as e:
+                logger.error(f"❌ Error collecting team info for team {team_id}: {e}")
+                return team_id, False
+    
+    async def _collect_arena_data_bounded(self, team_id: int) -> Tuple[int, bool]:
+        """
+        Collect and store one team's arena and price snapshots while holding an API semaphore slot.
+        
+        Args:
+            team_id: Team ID to collect arena data for
+            
+        Returns:
+            Tuple of (team_id, success) so results can be consumed out of order
+        """
+        async with self._api_semaphore:
+            await self._respect_rate_limits()
+            
+            try:
+                # Use the existing arena data collection method, off the event loop
+                success = await asyncio.to_thread(self.collector.collect_arena_data, self.api, str(team_id))
+                
+                if success:
+                    logger.debug(f"✅ Collected arena data for team {team_id}")
+                else:
+                    logger.warning(f"❌ Failed to collect arena data for team {team_id}")
+                return team_id, success
+                
+            except Exception as e:
+                logger.error(f"❌ Error collecting arena data for team {team_id}: {e}")
+                return team_id, False
+    
     async def task_5_collect_home_games(
         self, 
         team_ids: Set[int], 
         seasons: List[int],
-        max_teams_parallel: int = 6
+        max_teams_parallel: int = 6,
+        defer_game_indexes: bool = False
     ) -> TaskResult:
         """
         Task 5: Collect home games for all specified teams and seasons.
@@ -368,16 +445,24 @@ class TaskBasedCollector:
             team_ids: Set of team IDs to collect games for
             seasons: List of season numbers to collect games for (e.g., [68, 69])
             max_teams_parallel: Maximum number of teams to process in parallel
+            defer_game_indexes: Drop the games indexes during collection and rebuild
+                them at the end; worthwhile for large backfills run from the CLI.
+                Nothing else may open a DatabaseManager on the same file meanwhile:
+                the API routers build one per request, and its migrations recreate
+                the indexes mid-load, which undoes the deferral
             
         Returns:
             TaskResult with summary of collection
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = "collect_home_games"
         
         logger.info(f"🏈 Task 5: Collecting home games for {len(team_ids)} teams, seasons {seasons}")
         logger.info(f"   - Max teams in parallel: {max_teams_parallel}")
         
+        # Schedules may have changed since the last run, so start with a fresh cache
+        self._completed_cache.clear()
+        
         try:
             total_games_collected = 0
             total_games_skipped = 0
@@ -386,46 +471,44 @@ class TaskBasedCollector:
             # Convert team_ids to list for batching
             team_list = list(team_ids)
             
-            # Process teams in batches for controlled parallelization
-            for batch_start in range(0, len(team_list), max_teams_parallel):
-                batch_end = min(batch_start + max_teams_parallel, len(team_list))
-                batch_teams = team_list[batch_start:batch_end]
-                
-                logger.info(f"   📦 Processing batch {batch_start//max_teams_parallel + 1} of {len(team_list)//max_teams_parallel + 1}: teams {batch_teams}")
-                
-                # Create tasks for this batch
-                batch_tasks = []
-                for team_id in batch_teams:
-                    task = self._collect_team_games_for_seasons(team_id, seasons)
-                    batch_tasks.append(task)
-                
-                # Run batch in parallel
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                
-                # Process batch results
-                for i, result in enumerate(batch_results):
-                    team_id = batch_teams[i]
+            # A large backfill is cheaper with the secondary indexes built once at the end
+            index_context = self.db_manager.deferred_game_indexes() if defer_game_indexes else nullcontext()
+            with index_context:
+                # Process teams in batches for controlled parallelization
+                for batch_start in range(0, len(team_list), max_teams_parallel):
+                    batch_end = min(batch_start + max_teams_parallel, len(team_list))
+                    batch_teams = team_list[batch_start:batch_end]
                     
-                    if isinstance(result, Exception):
-                        logger.error(f"❌ Team {team_id} failed: {result}")
-                        failed_teams.append(team_id)
-                    elif isinstance(result, tuple) and len(result) == 2:
-                        # result is Tuple[int, int] here
-                        games_collected, games_skipped = result
-                        total_games_collected += games_collected
-                        total_games_skipped += games_skipped
-                        logger.debug(f"✅ Team {team_id}: {games_collected} collected, {games_skipped} skipped")
-                    else:
-                        # This shouldn't happen, but handle it gracefully
-                        logger.error(f"❌ Team {team_id}: Unexpected result type: {type(result)}")
-                        failed_teams.append(team_id)
-                
-                # Brief pause between batches to respect rate limits
-                if batch_end < len(team_list):
-                    logger.debug(f"   ⏸️ Pause between batches...")
-                    await asyncio.sleep(2.0)
+                    logger.info(f"   📦 Processing batch {batch_start//max_teams_parallel + 1} of {len(team_list)//max_teams_parallel + 1}: teams {batch_teams}")
+                    
+                    # Create tasks for this batch
+                    batch_tasks = []
+                    for team_id in batch_teams:
+                        task = self._collect_team_games_for_seasons(team_id, seasons)
+                        batch_tasks.append(task)
+                    
+                    # Run batch in parallel
+                    batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
+                    
+                    # Process batch results
+                    for i, result in enumerate(batch_results):
+                        team_id = batch_teams[i]
+                        
+                        if isinstance(result, Exception):
+                            logger.error(f"❌ Team {team_id} failed: {result}")
+                            failed_teams.append(team_id)
+                        elif isinstance(result, tuple) and len(result) == 2:
+                            # result is Tuple[int, int] here
+                            games_collected, games_skipped = result
+                            total_games_collected += games_collected
+                            total_games_skipped += games_skipped
+                            logger.debug(f"✅ Team {team_id}: {games_collected} collected, {games_skipped} skipped")
+                        else:
+                            # This shouldn't happen, but handle it gracefully
+                            logger.error(f"❌ Team {team_id}: Unexpected result type: {type(result)}")
+                            failed_teams.append(team_id)
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             successful_teams = len(team_ids) - len(failed_teams)
             success_rate = successful_teams / len(team_ids) if team_ids else 0
             
@@ -456,7 +539,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 5 failed: {e}")
             
             return TaskResult(
@@ -482,100 +565,111 @@ class TaskBasedCollector:
         
         for season in seasons:
             try:
-                # Get team schedule for this season
-                schedule_data = self.api.get_schedule(team_id, season)
+                # Get team schedule for this season. Finished seasons may be served from the
+                # client's on-disk schedule cache, which costs no request. Otherwise the request
+                # counts against the shared rate limit and runs in a worker thread so other
+                # teams keep fetching meanwhile
+                finished = self._is_season_finished(season)
+                schedule_data = self.api.get_cached_schedule(team_id, season, finished=finished)
+                if schedule_data is None:
+                    await self._respect_rate_limits()
+                    schedule_data = await asyncio.to_thread(
+                        self.api.get_schedule, team_id, season, finished=finished
+                    )
                 
-                if not schedule_data or 'games' not in schedule_data:
+                if not schedule_data or 'matches' not in schedule_data:
                     logger.warning(f"No schedule data for team {team_id}, season {season}")
                     continue
                 
-                # Debug: log first game to see available fields
-                if schedule_data['games']:
-                    # Debug: show home vs away game breakdown
-                    total_games = len(schedule_data['games'])
-                    home_games_count = sum(1 for g in schedule_data['games'] if g.get('home'))
-                    away_games_count = total_games - home_games_count
-                    logger.info(f"🏠 Team {team_id} season {season}: {total_games} total games ({home_games_count} home, {away_games_count} away)")
-                else:
-                    logger.info(f"⚠️ No games found in schedule for team {team_id}, season {season}")
-                
-                # Filter for completed home games only (exclude neutral games and future games)
-                home_games = []
-                for game in schedule_data['games']:
+                # Filter for completed home games only (exclude neutral games and future games).
+                # One pass over the schedule also counts home games for the breakdown log, and
+                # keeps only the game IDs, which is all the lookup and fetch steps below need
+                schedule_games = schedule_data['matches']
+                home_games_count = 0
+                home_game_ids: List[str] = []
+                for game in schedule_games:
                     # Only process home games (where this team is the home team)
-                    if not game.get('home'):
+                    if game.get('home_team_id') != team_id:
                         continue  # Skip away games entirely
+                    home_games_count += 1
                     
                     # Skip neutral and BBM games  
-                    if game.get('type') in ['bbm', 'pl.rsneutral']:
+                    if game.get('game_type') in ['bbm', 'pl.rsneutral']:
                         continue
                     
                     # Must have a game ID
-                    if not game.get('id'):
+                    game_id = game.get('match_id')
+                    if not game_id:
                         continue
                     
                     # Must be a completed game
                     if not self._is_game_completed(game, season):
                         continue
                     
-                    home_games.append(game)
+                    home_game_ids.append(str(game_id))
+                
+                if schedule_games:
+                    # Debug: show home vs away game breakdown
+                    total_games = len(schedule_games)
+                    away_games_count = total_games - home_games_count
+                    logger.info(f"🏠 Team {team_id} season {season}: {total_games} total games ({home_games_count} home, {away_games_count} away)")
+                else:
+                    logger.info(f"⚠️ No games found in schedule for team {team_id}, season {season}")
                 
-                logger.info(f"🏀 Team {team_id} season {season}: {len(home_games)} completed home games found")
+                logger.info(f"🏀 Team {team_id} season {season}: {len(home_game_ids)} completed home games found")
                 
-                # Check which games are already stored with attendance data
-                existing_games = self.db_manager.get_games_for_team(str(team_id))
-                games_with_attendance = {
-                    game.game_id for game in existing_games 
-                    if game.total_attendance is not None
-                }
+                # Look up stored attendance for just this season's games in one query
+                stored_attendance = self.db_manager.get_game_attendances(home_game_ids)
                 
                 # Filter to games that need collection (not stored OR missing attendance data)
                 games_to_collect = [
-                    game for game in home_games 
-                    if game['id'] not in games_with_attendance
+                    game_id for game_id in home_game_ids 
+                    if stored_attendance.get(game_id) is None
                 ]
                 
-                logger.info(f"📥 Team {team_id} season {season}: {len(games_to_collect)} new games to collect ({len(home_games) - len(games_to_collect)} already stored)")
+                logger.info(f"📥 Team {team_id} season {season}: {len(games_to_collect)} new games to collect ({len(home_game_ids) - len(games_to_collect)} already stored)")
                 
                 # Collect each game using the same pattern as frontend "Collect remaining"
                 season_collected = 0
                 if games_to_collect:
                     logger.info(f"🎯 Team {team_id} season {season}: Starting collection of {len(games_to_collect)} games...")
                 
-                for i, game in enumerate(games_to_collect, 1):
+                # Collect games concurrently; the shared semaphore bounds how many
+                # boxscore requests are in flight across all teams
+                pending = [
+                    asyncio.create_task(self._collect_single_game_bounded(game_id))
+                    for game_id in games_to_collect
+                ]
+                
+                # Records are saved together once the season's boxscores are in, so the
+                # whole season costs one transaction instead of one commit per game
+                season_records: List[GameRecord] = []
+                for i, future in enumerate(asyncio.as_completed(pending), 1):
                     try:
-                        # Progress update every 5 games or for the last game
-                        if i % 5 == 0 or i == len(games_to_collect):
-                            logger.info(f"   🏈 Team {team_id}: Collecting game {i}/{len(games_to_collect)} (ID: {game['id']})")
+                        game_id, game_record = await future
                         
-                        # Use the same game collection pattern as the backend API endpoint
-                        success = await self._collect_single_game(game['id'])
-                        
-                        if success:
-                            season_collected += 1
+                        if game_record is not None:
+                            season_records.append(game_record)
+                            # Progress update every 5 games or for the last game
                             if i % 5 == 0 or i == len(games_to_collect):
-                                logger.info(f"   ✅ Team {team_id}: {season_collected}/{i} games collected successfully")
+                                logger.info(f"   ✅ Team {team_id}: {len(season_records)}/{i} games fetched successfully")
                         else:
-                            logger.warning(f"   ❌ Team {team_id}: Failed to collect game {game['id']}")
-                        
-                        # Rate limiting between individual games
-                        await self._respect_rate_limits()
+                            logger.warning(f"   ❌ Team {team_id}: Failed to collect game {game_id}")
                         
                     except Exception as e:
-                        logger.error(f"   💥 Team {team_id}: Error collecting game {game['id']}: {e}")
+                        logger.error(f"   💥 Team {team_id}: Error collecting game: {e}")
                         continue
                 
+                if season_records:
+                    season_collected = self.db_manager.save_game_records(season_records)
+                
                 total_collected += season_collected
-                total_skipped += len(home_games) - len(games_to_collect)
+                total_skipped += len(home_game_ids) - len(games_to_collect)
                 
                 # Summary for this season
                 if games_to_collect:
                     success_rate = season_collected / len(games_to_collect) if games_to_collect else 0
                     logger.info(f"🏁 Team {team_id} season {season}: Completed! {season_collected}/{len(games_to_collect)} games collected ({success_rate:.1%})")
-                
-                # Extra delay between seasons for the same team
-                if len(seasons) > 1:
-                    await asyncio.sleep(1.0)
                     
             except Exception as e:
                 logger.error(f"Error collecting season {season} for team {team_id}: {e}")
@@ -588,7 +682,8 @@ class TaskBasedCollector:
         Task 6: Update game pricing from arena webpage for all teams.
         
         This task depends on Task 5 completing successfully and having games in the database.
-        No parallelization - processes teams sequentially to avoid overwhelming the server.
+        Teams are processed concurrently, but the webpage semaphore and the shared rate
+        limiter keep the load on the server bounded.
         
         Args:
             team_ids: Set of team IDs to update pricing for
@@ -596,11 +691,11 @@ class TaskBasedCollector:
         Returns:
             TaskResult with summary of pricing updates
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = "update_game_pricing"
         
         logger.info(f"💰 Task 6: Updating game pricing for {len(team_ids)} teams")
-        logger.info(f"   - Processing teams sequentially (no parallelization)")
+        logger.info(f"   - Max teams in parallel: {self.rate_config.max_concurrent_requests}")
         
         try:
             total_periods_created = 0
@@ -608,28 +703,26 @@ class TaskBasedCollector:
             successful_teams = 0
             failed_teams = []
             
-            for i, team_id in enumerate(sorted(team_ids), 1):
-                logger.info(f"💰 Team {i}/{len(team_ids)}: Updating pricing for team {team_id}")
+            pending = [
+                asyncio.create_task(self._update_team_pricing_bounded(team_id))
+                for team_id in sorted(team_ids)
+            ]
+            
+            for i, future in enumerate(asyncio.as_completed(pending), 1):
+                team_id, counts = await future
                 
-                try:
-                    # Call the core pricing update logic
-                    periods_created, games_updated = await self._update_team_pricing(team_id)
-                    
-                    total_periods_created += periods_created
-                    total_games_updated += games_updated
-                    successful_teams += 1
-                    
-                    logger.info(f"✅ Team {team_id}: {periods_created} periods created, {games_updated} games updated")
-                    
-                    # Rate limiting between teams
-                    await self._respect_rate_limits()
-                    
-                except Exception as e:
-                    logger.error(f"❌ Team {team_id}: Error updating pricing: {e}")
+                if counts is None:
                     failed_teams.append(team_id)
                     continue
+                
+                periods_created, games_updated = counts
+                total_periods_created += periods_created
+                total_games_updated += games_updated
+                successful_teams += 1
+                
+                logger.info(f"✅ Team {team_id} ({i}/{len(team_ids)}): {periods_created} periods created, {games_updated} games updated")
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             success_rate = successful_teams / len(team_ids) if team_ids else 0
             
             logger.info(f"✅ Task 6 completed!")
@@ -658,7 +751,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 6 failed: {e}")
             
             return TaskResult(
@@ -668,6 +761,26 @@ class TaskBasedCollector:
                 execution_time=execution_time
             )
     
+    async def _update_team_pricing_bounded(self, team_id: int) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """
+        Update one team's pricing while holding a webpage semaphore slot.
+        
+        Args:
+            team_id: Team ID to update pricing for
+            
+        Returns:
+            Tuple of (team_id, (periods_created, games_updated)); the counts are None on failure
+        """
+        async with self._webpage_semaphore:
+            await self._respect_rate_limits()
+            logger.info(f"💰 Updating pricing for team {team_id}")
+            
+            try:
+                return team_id, await self._update_team_pricing(team_id)
+            except Exception as e:
+                logger.error(f"❌ Team {team_id}: Error updating pricing: {e}")
+                return team_id, None
+    
     async def _update_team_pricing(self, team_id: int) -> Tuple[int, int]:
         """Update pricing for a single team using the existing collecting logic.
         
@@ -694,7 +807,7 @@ class TaskBasedCollector:
     
     def _is_game_completed(self, game: dict, season: int) -> bool:
         """
-        Check if a game is completed by looking for scores in the schedule data.
+        Check if a game is completed, reusing earlier results for the same game.
         
         Args:
             game: Game data from schedule API
@@ -703,81 +816,165 @@ class TaskBasedCollector:
         Returns:
             True if game has been played (has scores), False if future game
         """
-        # The schedule parser currently sets scores to None, but let's check if the raw data has them
-        # First, try the parsed fields (though they're currently always None)
-        home_score = game.get('score_home')
-        away_score = game.get('score_away')
-        
-        # Game is completed if both scores are present and are numbers
-        if (home_score is not None and away_score is not None and
-            isinstance(home_score, (int, float)) and isinstance(away_score, (int, float))):
+        game_id = game.get('match_id')
+        if game_id is None:
+            return self._check_game_completed(game, season)
+        
+        key = (game_id, season)
+        completed = self._completed_cache.get(key)
+        if completed is None:
+            completed = self._check_game_completed(game, season)
+            self._completed_cache[key] = completed
+        return completed
+    
+    def _check_game_completed(self, game: dict, season: int) -> bool:
+        """
+        Check if a game is completed by looking for scores in the schedule data.
+        
+        Args:
+            game: Game data from schedule API. Scores are already coerced to
+                int (or None for unplayed games) by the API client's schedule
+                parser, so they are not type-checked again here.
+            season: Season number being processed
+            
+        Returns:
+            True if game has been played (has scores), False if future game
+        """
+        # The schedule parser leaves scores as None for games that have not been played
+        home_score = game.get('home_score')
+        away_score = game.get('away_score')
+        
+        # Game is completed if both scores are present
+        if home_score is not None and away_score is not None:
             return True
         
         # If the parser didn't extract scores, check other possible score fields
         # that might be in the game data
-        for score_field in ['home_score', 'away_score', 'score', 'scores']:
-            if score_field in game and game[score_field] is not None:
+        for score_field in _SCORE_FIELDS & game.keys():
+            if game[score_field] is not None:
                 return True
         
-        # For completed historical seasons, all games should be finished
-        # Since the schedule parser doesn't extract scores, but we know historical games are completed
+        # For completed historical seasons, all games should be finished, even when
+        # the schedule omits their scores
         if season <= 68:  # Completed historical seasons
-            logger.debug(f"Game {game.get('id')} is from completed season {season} - assuming completed")
+            # Runs for every historical schedule game, so only format the message when it will be emitted
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Game {game.get('match_id')} is from completed season {season} - assuming completed")
             return True
         
         # For current/future seasons, we need proper score detection
-        # For debugging: log what fields are available (only for first few games)
-        if not hasattr(self, '_debug_logged'):
-            self._debug_logged = True
-            logger.info(f"🔍 Game {game.get('id', 'unknown')} fields: {list(game.keys())}")
-            logger.info(f"🔍 Game {game.get('id', 'unknown')} data: {game}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Game {game.get('match_id', 'unknown')} has no scores, fields: {list(game.keys())}")
         
         # If no score indicators found, assume it's a future game
         return False
     
-    async def _collect_single_game(self, game_id: str) -> bool:
+    def _get_season_ranges(self) -> List[Tuple[float, float, int]]:
+        """
+        Get season date ranges, loading them from the database on first use.
+        
+        Returns:
+            List of (start_timestamp, end_timestamp, season_number) tuples sorted
+            by start. The current season has an infinite end timestamp.
+        """
+        if not self._season_ranges:
+            ranges = build_season_ranges(self.db_manager.get_all_seasons())
+            self._season_ranges = ranges
+            self._season_starts = [start_ts for start_ts, _, _ in ranges]
+        return self._season_ranges
+    
+    def _is_season_finished(self, season: int) -> bool:
         """
-        Collect a single game using the clean architecture.
+        Check whether a season has ended according to the cached season ranges.
         
         Args:
-            game_id: Game ID to collect
+            season: Season number to check
+            
+        Returns:
+            True if the season has an end date in the past, False otherwise
+        """
+        now_ts = time.time()
+        return any(
+            season_number == season and end_ts < now_ts
+            for _, end_ts, season_number in self._get_season_ranges()
+        )
+    
+    def _resolve_season(self, game_date_str: str) -> Optional[int]:
+        """
+        Calculate season number from a game date using the cached season ranges.
+        
+        Args:
+            game_date_str: ISO date string from game data
             
         Returns:
-            True if successful, False otherwise
+            Season number if found, None otherwise
         """
+        if not game_date_str:
+            return None
+        
         try:
-            # Check if we already have this game with attendance data
-            stored_game = self.db_manager.get_game_by_id(game_id)
-            if stored_game and stored_game.total_attendance is not None:
-                logger.debug(f"Game {game_id} already has attendance data, skipping")
-                return True
+            parsed_game_date = parse_game_date(game_date_str)
+        except ValueError as e:
+            logger.warning(f"Could not parse game date '{game_date_str}' for season calculation: {e}")
+            return None
+        
+        season = resolve_season(parsed_game_date, self._get_season_ranges(), self._season_starts)
+        if season is not None:
+            return season
+        
+        logger.warning(f"Could not determine season for date {parsed_game_date}")
+        return None
+    
+    async def _collect_single_game_bounded(self, game_id: str) -> Tuple[str, Optional[GameRecord]]:
+        """
+        Collect a single game while holding a slot of the shared game semaphore.
+        
+        Args:
+            game_id: Game ID to collect
             
-            # Fetch boxscore data from API (now returns typed BoxscoreData)
-            boxscore_data = self.api.get_boxscore(game_id)
+        Returns:
+            Tuple of (game_id, game_record) so results can be consumed out of order
+        """
+        async with self._game_semaphore:
+            await self._respect_rate_limits()
+            return game_id, await self._collect_single_game(game_id)
+    
+    async def _collect_single_game(self, game_id: str) -> Optional[GameRecord]:
+        """
+        Fetch a single game and build its record using the clean architecture.
+        
+        Callers are expected to have skipped games that already have attendance
+        data, using one bulk lookup per season rather than a query per game, and
+        to save the returned records in bulk.
+        
+        Args:
+            game_id: Game ID to collect
+            
+        Returns:
+            GameRecord if successful, None otherwise
+        """
+        try:
+            # Fetch boxscore data from API (now returns typed BoxscoreData).
+            # Run the blocking request in a worker thread so concurrent game
+            # collections overlap their network latency.
+            boxscore_data = await asyncio.to_thread(self.api.get_boxscore, game_id)
             if not boxscore_data:
                 logger.warning(f"No boxscore data returned for game {game_id}")
-                return False
+                return None
             
-            # Calculate season from game date using shared function
-            from ..api.routers.games import get_season_from_date
-            calculated_season = get_season_from_date(boxscore_data["start_date"], self.db_manager)
+            # Calculate season from game date using the cached season ranges
+            calculated_season = self._resolve_season(boxscore_data["start_date"])
             
             if calculated_season is None:
                 logger.warning(f"Could not determine season for game {game_id}")
-                return False
+                return None
                 
             # Create GameRecord using the clean factory method  
-            from ..storage.models import GameRecord
-            game_record = GameRecord.from_api_data(boxscore_data, season=calculated_season)
-            
-            # Save to database (preserves existing pricing data)
-            saved_id = self.db_manager.save_game_record(game_record)
-            logger.debug(f"Successfully saved game {game_id} with database ID {saved_id}")
-            return True
+            return GameRecord.from_api_data(boxscore_data, season=calculated_season)
                 
         except Exception as e:
             logger.error(f"Error collecting game {game_id}: {e}")
-            return False
+            return None
     
     async def task_4_collect_team_history(self, team_ids: Set[int]) -> TaskResult:
         """
@@ -789,68 +986,40 @@ class TaskBasedCollector:
         Returns:
             TaskResult with summary of collection
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         task_name = "collect_team_history"
         
         logger.info(f"📚 Task 4: Collecting team history for {len(team_ids)} teams")
         
         try:
-            successful_collections = 0
-            failed_collections = 0
-            failed_teams = []
-            total_history_entries = 0
+            outcomes: List[Tuple[int, Optional[int]]] = []
+            failed_teams: List[int] = []
             
-            for i, team_id in enumerate(team_ids, 1):
-                logger.debug(f"[{i}/{len(team_ids)}] Collecting team history for team {team_id}")
-                
-                try:
-                    # Get team history from webpage
-                    history_data = self.api.get_team_history_from_webpage(team_id)
-                    
-                    if history_data:
-                        # Convert dictionary data to TeamLeagueHistory objects
-                        from ..storage.models import TeamLeagueHistory
-                        
-                        history_objects = []
-                        for entry in history_data:
-                            history_obj = TeamLeagueHistory.from_webpage_data(
-                                team_id=str(team_id),
-                                season=entry['season'],
-                                team_name=entry['team_name'],
-                                league_id=entry['league_id'],
-                                league_name=entry['league_name'],
-                                league_level=entry.get('league_level'),
-                                achievement=entry.get('achievement'),
-                                is_active_team=entry.get('is_active_team', True)
-                            )
-                            history_objects.append(history_obj)
-                        
-                        # Store history objects in database
-                        self.db_manager.save_team_league_history(team_id, history_objects)
-                        
-                        total_history_entries += len(history_objects)
-                        logger.debug(f"✅ Saved {len(history_objects)} history entries for team {team_id}")
-                        successful_collections += 1
-                    else:
-                        logger.warning(f"❌ No team history returned for team {team_id}")
-                        failed_collections += 1
-                        failed_teams.append(team_id)
-                    
-                    # Rate limiting - extra delay for web scraping
-                    await asyncio.sleep(self.rate_config.min_delay_between_requests + 1.0)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error collecting team history for team {team_id}: {e}")
-                    failed_collections += 1
+            # Scrape history pages concurrently; the semaphore and the shared
+            # rate limiter bound how many requests are in flight
+            pending = [
+                asyncio.create_task(self._collect_team_history_bounded(team_id))
+                for team_id in team_ids
+            ]
+            
+            for i, future in enumerate(asyncio.as_completed(pending), 1):
+                team_id, entries_saved = await future
+                outcomes.append((team_id, entries_saved))
+                if entries_saved is None:
                     failed_teams.append(team_id)
                 
                 # Progress updates
                 if i % 25 == 0:
                     progress = i / len(team_ids)
                     logger.info(f"   📈 Task 4 Progress: {progress:.1%} ({i}/{len(team_ids)}) - "
-                               f"Success: {successful_collections}, Failed: {failed_collections}")
+                               f"Success: {i - len(failed_teams)}, Failed: {len(failed_teams)}")
             
-            execution_time = time.time() - start_time
+            # Summarize the per-team outcomes once instead of keeping running counters
+            failed_collections = len(failed_teams)
+            successful_collections = len(outcomes) - failed_collections
+            total_history_entries = sum(entries for _, entries in outcomes if entries is not None)
+            
+            execution_time = time.monotonic() - start_time
             success_rate = successful_collections / len(team_ids) if team_ids else 0
             
             logger.info(f"✅ Task 4 completed!")
@@ -877,7 +1046,7 @@ class TaskBasedCollector:
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             logger.error(f"❌ Task 4 failed: {e}")
             
             return TaskResult(
@@ -887,25 +1056,65 @@ class TaskBasedCollector:
                 execution_time=execution_time
             )
     
-    async def _respect_rate_limits(self):
-        """Implement rate limiting between API calls."""
-        current_time = time.time()
-        
-        # Calculate delay based on configuration
-        time_since_last = current_time - self.last_request_time
-        min_delay = self.rate_config.min_delay_between_requests
-        
-        if time_since_last < min_delay:
-            delay = min_delay - time_since_last
-            await asyncio.sleep(delay)
+    async def _collect_team_history_bounded(self, team_id: int) -> Tuple[int, Optional[int]]:
+        """
+        Scrape and store one team's history while holding a webpage semaphore slot.
         
-        self.last_request_time = time.time()
-        self.request_count += 1
+        Args:
+            team_id: Team ID to collect history for
+            
+        Returns:
+            Tuple of (team_id, entries_saved); entries_saved is None if collection failed
+        """
+        async with self._webpage_semaphore:
+            await self._respect_rate_limits()
+            
+            try:
+                # The scrape uses the blocking requests session, so run it off the event loop
+                history_data = await asyncio.to_thread(self.api.get_team_history_from_webpage, team_id)
+                
+                if history_data:
+                    # Store the parsed rows directly in one bulk write
+                    self.db_manager.save_team_league_history_bulk(team_id, history_data)
+                    logger.debug(f"✅ Saved {len(history_data)} history entries for team {team_id}")
+                    entries_saved: Optional[int] = len(history_data)
+                else:
+                    logger.warning(f"❌ No team history returned for team {team_id}")
+                    entries_saved = None
+                
+            except Exception as e:
+                logger.error(f"❌ Error collecting team history for team {team_id}: {e}")
+                entries_saved = None
+            
+            return team_id, entries_saved
+    
+    async def _respect_rate_limits(self):
+        """Implement rate limiting between API calls.
         
-        # Additional rate limiting per minute
-        if self.request_count % self.rate_config.requests_per_minute == 0:
-            logger.debug(f"Rate limit: Made {self.request_count} requests, brief pause")
-            await asyncio.sleep(2.0)
+        All tasks running on this collector share one budget: requests are
+        spaced by the minimum delay and capped at requests_per_minute over a
+        sliding 60 second window. Serialized with a lock so concurrent
+        coroutines read and update the shared timing state one at a time.
+        """
+        async with self._rate_limit_lock:
+            # Space consecutive requests by the minimum delay
+            time_since_last = time.monotonic() - self.last_request_time
+            min_delay = self.rate_config.min_delay_between_requests
+            
+            if time_since_last < min_delay:
+                delay = min_delay - time_since_last
+                await asyncio.sleep(delay)
+            
+            # Wait for the oldest request to leave the window once the budget is used up
+            if len(self._request_times) == self._request_times.maxlen:
+                window_wait = 60.0 - (time.monotonic() - self._request_times[0])
+                if window_wait > 0:
+                    logger.debug(f"Rate limit: Made {self.request_count} requests, waiting {window_wait:.1f}s")
+                    await asyncio.sleep(window_wait)
+            
+            self.last_request_time = time.monotonic()
+            self._request_times.append(self.last_request_time)
+            self.request_count += 1
     
     def save_task_result(self, result: TaskResult, output_dir: Optional[str] = None):
         """Save task result to disk for analysis/debugging."""
@@ -929,8 +1138,7 @@ class TaskBasedCollector:
             "data": list(result.data) if isinstance(result.data, set) else result.data
         }
         
-        with open(output_path / filename, 'w') as f:
-            json.dump(result_data, f, indent=2)
+        (output_path / filename).write_bytes(_dump_json(result_data))
         
         logger.info(f"💾 Saved task result to {output_path / filename}")
 
@@ -1036,7 +1244,8 @@ async def run_complete_data_collection_pipeline(
     db_manager: DatabaseManager,
     team_ids: Set[int],
     seasons: List[int] = [68, 69],
-    include_pricing_update: bool = True
+    include_pricing_update: bool = True,
+    rate_config: Optional[RateLimitConfig] = None
 ) -> Tuple[TaskResult, TaskResult, TaskResult, TaskResult, TaskResult | None]:
     """
     Run the complete data collection pipeline: team discovery, then parallel collection, 
@@ -1048,12 +1257,14 @@ async def run_complete_data_collection_pipeline(
         team_ids: Set of team IDs to collect data for
         seasons: List of seasons for game collection
         include_pricing_update: Whether to run Task 6 (pricing updates)
+        rate_config: Rate limit budget shared by all tasks of the pipeline
         
     Returns:
         Tuple of (team_info_result, arena_result, history_result, games_result, pricing_result)
         pricing_result will be None if include_pricing_update is False or games collection failed
     """
-    collector = TaskBasedCollector(api, db_manager)
+    # A single collector means tasks 2-5 draw from one shared rate limit budget
+    collector = TaskBasedCollector(api, db_manager, rate_config)
     
     # Phase 1: Run tasks 2, 3, 4, 5 in parallel
     logger.info(f"🚀 Phase 1: Running team info, arena, history, and games collection in parallel for {len(team_ids)} teams")
@@ -2,6 +2,8 @@
 
 import logging
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +20,18 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """Manages SQLite database operations for BuzzerBeater data."""
 
+    # Secondary indexes on games by name and column. game_id lookups use the
+    # index SQLite creates for its UNIQUE constraint, which is not listed here
+    _GAME_INDEXES = {
+        "idx_games_home_team": "home_team_id",
+        "idx_games_away_team": "away_team_id",
+        "idx_games_date": "date",
+        "idx_games_season": "season",
+        "idx_games_division": "division",
+        "idx_games_country": "country",
+        "idx_games_cup_round": "cup_round",
+    }
+
     def __init__(self, db_path: str | Path = "bb_arena_data.db"):
         """Initialize database manager.
 
@@ -37,6 +51,9 @@ class DatabaseManager:
         """Create database and tables if they don't exist."""
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("PRAGMA foreign_keys = ON")
+            # WAL is stored in the database file, so every later connection commits
+            # by appending to the log instead of rewriting pages through a rollback journal
+            conn.execute("PRAGMA journal_mode = WAL")
 
             # Create arena_snapshots table
             conn.execute("""
@@ -181,16 +198,7 @@ class DatabaseManager:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_price_snapshots_team_id ON price_snapshots(team_id)"
             )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_games_home_team ON games(home_team_id)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_games_away_team ON games(away_team_id)"
-            )
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_games_date ON games(date)")
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_games_game_id ON games(game_id)"
-            )
+            # Game indexes are created by the migrations, once all indexed columns exist
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_seasons_number ON seasons(season_number)"
             )
@@ -248,15 +256,41 @@ class DatabaseManager:
         
         # Add new indexes for better query performance
         try:
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_games_season ON games(season)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_games_division ON games(division)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_games_country ON games(country)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_games_cup_round ON games(cup_round)")
+            self._create_game_indexes(conn)
+            # Duplicated the UNIQUE(game_id) index, costing an extra write per saved game
+            conn.execute("DROP INDEX IF EXISTS idx_games_game_id")
         except sqlite3.OperationalError:
             pass  # Indexes might already exist
             
         conn.commit()
 
+    def _create_game_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create any missing secondary indexes on the games table."""
+        for index_name, column in self._GAME_INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON games({column})")
+
+    @contextmanager
+    def deferred_game_indexes(self) -> Iterator[None]:
+        """Drop the games table's secondary indexes for a bulk load and rebuild them on exit.
+
+        Each index is then built once from the finished table instead of being
+        updated row by row. The UNIQUE(game_id) index is kept, so upserts and
+        stored-ID lookups still work during the load.
+
+        Only use this from a standalone backfill. Creating another DatabaseManager
+        on the same file, as the API routers do per request, reruns the migrations
+        and rebuilds the indexes while the load is still running.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            for index_name in self._GAME_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+        try:
+            yield
+        finally:
+            with sqlite3.connect(self.db_path) as conn:
+                self._create_game_indexes(conn)
+            logger.info("Rebuilt game indexes after bulk load")
+
     def save_price_snapshot(self, price_snapshot: PriceSnapshot) -> int:
         """Save price snapshot to database.
 
@@ -386,35 +420,30 @@ class DatabaseManager:
             Dictionary with database statistics
         """
         with sqlite3.connect(self.db_path) as conn:
-            stats = {}
-
-            # Count records in each table
-            cursor = conn.execute("SELECT COUNT(*) FROM arena_snapshots")
-            stats["arena_snapshots"] = cursor.fetchone()[0]
-
-            cursor = conn.execute("SELECT COUNT(*) FROM price_snapshots")
-            stats["price_snapshots"] = cursor.fetchone()[0]
-
-            cursor = conn.execute("SELECT COUNT(*) FROM games")
-            stats["total_games"] = cursor.fetchone()[0]
-
-            # Count unique teams
+            # All counts in one statement; the games aggregates share one pass over
+            # games, and MIN/MAX skip NULL dates
             cursor = conn.execute(
-                """SELECT COUNT(DISTINCT team_id) FROM (
-                    SELECT home_team_id as team_id FROM games WHERE home_team_id IS NOT NULL
-                    UNION
-                    SELECT away_team_id as team_id FROM games WHERE away_team_id IS NOT NULL
-                )"""
+                """SELECT
+                    (SELECT COUNT(*) FROM arena_snapshots),
+                    (SELECT COUNT(*) FROM price_snapshots),
+                    game_stats.total_games,
+                    game_stats.earliest_game,
+                    game_stats.latest_game,
+                    (SELECT COUNT(DISTINCT team_id) FROM (
+                        SELECT home_team_id as team_id FROM games WHERE home_team_id IS NOT NULL
+                        UNION
+                        SELECT away_team_id as team_id FROM games WHERE away_team_id IS NOT NULL
+                    ))
+                FROM (
+                    SELECT COUNT(*) AS total_games, MIN(date) AS earliest_game, MAX(date) AS latest_game
+                    FROM games
+                ) AS game_stats"""
             )
-            stats["unique_teams"] = cursor.fetchone()[0]
-
-            # Date range of games
-            cursor = conn.execute(
-                "SELECT MIN(date), MAX(date) FROM games WHERE date IS NOT NULL"
+            stat_names = (
+                "arena_snapshots", "price_snapshots", "total_games",
+                "earliest_game", "latest_game", "unique_teams",
             )
-            date_range = cursor.fetchone()
-            stats["earliest_game"] = date_range[0]
-            stats["latest_game"] = date_range[1]
+            stats = dict(zip(stat_names, cursor.fetchone(), strict=True))
 
             return stats
 
@@ -503,14 +532,30 @@ class DatabaseManager:
         """Delegate to game manager."""
         return self.game_manager.save_game_record(game_record)
     
+    def save_game_records(self, game_records: list[GameRecord]) -> int:
+        """Delegate to game manager."""
+        return self.game_manager.save_game_records(game_records)
+    
     def get_games_for_team(self, team_id: str, limit: int | None = None) -> list[GameRecord]:
         """Delegate to game manager."""
         return self.game_manager.get_games_for_team(team_id, limit)
     
+    def get_home_games_missing_scores(self, team_id: int) -> list[GameRecord]:
+        """Delegate to game manager."""
+        return self.game_manager.get_home_games_missing_scores(team_id)
+    
     def get_game_by_id(self, game_id: str) -> GameRecord | None:
         """Delegate to game manager."""
         return self.game_manager.get_game_by_id(game_id)
     
+    def get_stored_game_ids(self, game_ids: list[str]) -> frozenset[str]:
+        """Delegate to game manager."""
+        return self.game_manager.get_stored_game_ids(game_ids)
+    
+    def get_game_attendances(self, game_ids: list[str]) -> dict[str, int | None]:
+        """Delegate to game manager."""
+        return self.game_manager.get_game_attendances(game_ids)
+    
     def get_prefix_max_attendance(self, team_id: str, up_to_date: str) -> dict[str, int]:
         """Delegate to game manager."""
         return self.game_manager.get_prefix_max_attendance(team_id, up_to_date)
@@ -550,6 +595,10 @@ class DatabaseManager:
         """Delegate to team manager."""
         return self.team_manager.save_team_league_history(team_id, history_entries)
     
+    def save_team_league_history_bulk(self, team_id: int, raw_entries: list[dict[str, Any]]) -> None:
+        """Delegate to team manager."""
+        return self.team_manager.save_team_league_history_bulk(team_id, raw_entries)
+    
     def get_team_league_history(self, team_id: int, active_only: bool = True) -> list:
         """Delegate to team manager."""
         return self.team_manager.get_team_league_history(team_id, active_only)
@@ -605,7 +654,8 @@ class DatabaseManager:
         team_id: str, 
         start_time: datetime, 
         end_time: datetime,
-        home_games_only: bool = True
+        home_games_only: bool = True,
+        exclude_game_ids: frozenset[str] | None = None
     ) -> list[GameRecord]:
         """
         Query database for team's games within specified time range.
@@ -616,6 +666,8 @@ class DatabaseManager:
             start_time: Start of time range (UTC)
             end_time: End of time range (UTC)  
             home_games_only: If True, only return home games
+            exclude_game_ids: Game IDs to leave out, filtered by SQLite rather than
+                after loading the rows
             
         Returns:
             List of GameRecord objects within the time range
@@ -640,6 +692,11 @@ class DatabaseManager:
             if home_games_only:
                 query += " AND home_team_id = ?"
                 params.append(team_id_int)
+            
+            if exclude_game_ids:
+                placeholders = ", ".join("?" * len(exclude_game_ids))
+                query += f" AND game_id NOT IN ({placeholders})"
+                params.extend(exclude_game_ids)
                 
             query += " ORDER BY date"
             
@@ -664,7 +721,7 @@ class DatabaseManager:
                     lower_tier_attendance=row[13],
                     courtside_attendance=row[14],
                     luxury_boxes_attendance=row[15],
-                    total_attendance=row[16],
+                    # row[16] is total_attendance, which GameRecord derives from the sections
                     neutral_arena=bool(row[17]),
                     ticket_revenue=row[18],
                     calculated_revenue=row[19],
@@ -690,6 +747,25 @@ class DatabaseManager:
         Returns:
             True if update was successful
         """
+        return self.update_game_prices_by_id(game.game_id, {
+            "bleachers_price": game.bleachers_price,
+            "lower_tier_price": game.lower_tier_price,
+            "courtside_price": game.courtside_price,
+            "luxury_boxes_price": game.luxury_boxes_price,
+        })
+    
+    def update_game_prices_by_id(self, game_id: str, prices: dict[str, int | None]) -> bool:
+        """
+        Update game prices in database without loading the game record first.
+        
+        Args:
+            game_id: ID of the game to update
+            prices: Mapping with bleachers_price, lower_tier_price, courtside_price
+                and luxury_boxes_price (missing keys are stored as NULL)
+            
+        Returns:
+            True if the game exists and was updated
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
                 query = """
@@ -700,23 +776,23 @@ class DatabaseManager:
                     WHERE game_id = ?
                 """
                 params = [
-                    game.bleachers_price,
-                    game.lower_tier_price,
-                    game.courtside_price,
-                    game.luxury_boxes_price,
-                    game.game_id
+                    prices.get("bleachers_price"),
+                    prices.get("lower_tier_price"),
+                    prices.get("courtside_price"),
+                    prices.get("luxury_boxes_price"),
+                    game_id
                 ]
                 
                 cursor = conn.execute(query, params)
                 success = cursor.rowcount > 0
                 
                 if success:
-                    logger.info(f"Updated prices for game {game.game_id}")
+                    logger.info(f"Updated prices for game {game_id}")
                 else:
-                    logger.warning(f"No rows updated for game {game.game_id}")
+                    logger.warning(f"No rows updated for game {game_id}")
                     
                 return success
                 
         except Exception as e:
-            logger.error(f"Error updating prices for game {game.game_id}: {e}")
+            logger.error(f"Error updating prices for game {game_id}: {e}")
             return False
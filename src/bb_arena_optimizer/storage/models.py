@@ -1,11 +1,20 @@
 """Database models for storing BuzzerBeater data."""
 
+import re
 from dataclasses import dataclass, asdict
 from datetime import datetime, UTC as datetime_utc
 from typing import Any, Dict
 
 from bb_arena_optimizer.api.client import BoxscoreData, ScheduleMatchData
 
+# Roman numeral division in league names such as 'USA III.1'
+_LEAGUE_ROMAN_RE = re.compile(r'\b([IVX]+)\.\d+')
+
+_ROMAN_TO_INT = {
+    'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
+    'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10
+}
+
 
 @dataclass
 class ArenaSnapshot:
@@ -76,7 +85,7 @@ class PriceSnapshot:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRecord:
     """Represents a game/match record with attendance and revenue data."""
 
@@ -120,20 +129,19 @@ class GameRecord:
     @property
     def total_attendance(self) -> int | None:
         """Calculate total attendance from individual section attendances."""
-        attendances = [
-            self.bleachers_attendance,
-            self.lower_tier_attendance,
-            self.courtside_attendance,
-            self.luxury_boxes_attendance
-        ]
+        # The four sections are fixed, so read them once into locals rather than
+        # building lists and running generators on every access
+        bleachers = self.bleachers_attendance
+        lower_tier = self.lower_tier_attendance
+        courtside = self.courtside_attendance
+        luxury_boxes = self.luxury_boxes_attendance
         
         # Only calculate if we have at least one non-None attendance value
-        valid_attendances = [a for a in attendances if a is not None]
-        if not valid_attendances:
+        if bleachers is None and lower_tier is None and courtside is None and luxury_boxes is None:
             return None
             
         # Sum all valid attendances (treat None as 0)
-        return sum(a if a is not None else 0 for a in attendances)
+        return (bleachers or 0) + (lower_tier or 0) + (courtside or 0) + (luxury_boxes or 0)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert GameRecord to JSON-serializable dictionary."""
@@ -179,12 +187,8 @@ class GameRecord:
             raise ValueError("BoxscoreData start_date is required but was empty after stripping")
         
         try:
-            # Handle timezone-aware strings (with Z or +00:00)
-            if start_date_str.endswith("Z"):
-                # Replace Z with +00:00 for ISO format parsing
-                game_date = datetime.fromisoformat(start_date_str.replace("Z", "+00:00"))
-            elif "+" in start_date_str or start_date_str.endswith("00:00"):
-                # Already has timezone info
+            # Handle timezone-aware strings (with Z or +00:00); fromisoformat accepts both
+            if start_date_str.endswith("Z") or "+" in start_date_str or start_date_str.endswith("00:00"):
                 game_date = datetime.fromisoformat(start_date_str)
             else:
                 # Assume naive datetime string is in UTC
@@ -240,14 +244,14 @@ class Season:
         if season_data.get("start"):
             try:
                 # Parse ISO format dates from BBAPI
-                start_date = datetime.fromisoformat(season_data["start"].replace('Z', '+00:00'))
+                start_date = datetime.fromisoformat(season_data["start"])
             except (ValueError, TypeError):
                 pass
                 
         if season_data.get("end"):
             try:
                 # Parse ISO format dates from BBAPI
-                end_date = datetime.fromisoformat(season_data["end"].replace('Z', '+00:00'))
+                end_date = datetime.fromisoformat(season_data["end"])
             except (ValueError, TypeError):
                 pass
         
@@ -328,7 +332,7 @@ class LeagueHierarchy:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamLeagueHistory:
     """Represents a team's league information for a specific season."""
     
@@ -374,17 +378,9 @@ class TeamLeagueHistory:
             return None
             
         # Extract the Roman numeral from league name
-        import re
-        roman_match = re.search(r'\b([IVX]+)\.\d+', self.league_name)
+        roman_match = _LEAGUE_ROMAN_RE.search(self.league_name)
         if not roman_match:
             return None
             
-        roman_numeral = roman_match.group(1)
-        
         # Convert Roman numeral to integer
-        roman_to_int = {
-            'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
-            'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10
-        }
-        
-        return roman_to_int.get(roman_numeral)
+        return _ROMAN_TO_INT.get(roman_match.group(1))
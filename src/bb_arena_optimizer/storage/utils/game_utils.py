@@ -2,6 +2,7 @@
 
 import sqlite3
 from datetime import datetime, UTC as datetime_utc
+from operator import attrgetter
 from pathlib import Path
 
 from ..models import GameRecord
@@ -60,6 +61,33 @@ class GameRecordManager:
         if errors:
             raise ValueError(f"Invalid game record data: {'; '.join(errors)}")
 
+    _INSERT_COLUMNS = [
+        "game_id", "home_team_id", "away_team_id", "date", "game_type",
+        "season", "division", "country", "cup_round",
+        "score_home", "score_away", "bleachers_attendance",
+        "lower_tier_attendance", "courtside_attendance",
+        "luxury_boxes_attendance", "total_attendance", "neutral_arena",
+        "ticket_revenue", "bleachers_price", "lower_tier_price", 
+        "courtside_price", "luxury_boxes_price", "created_at", "updated_at"
+    ]
+
+    # Every column but updated_at is a GameRecord attribute of the same name (total_attendance
+    # is a property), so one attrgetter call reads a row's values in column order
+    _RECORD_VALUES = attrgetter(*_INSERT_COLUMNS[:-1])
+
+    # Insert-or-update in one statement; COALESCE keeps stored values where the new record has nulls
+    _UPSERT_SQL = (
+        f"INSERT INTO games ({', '.join(_INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join(['?'] * len(_INSERT_COLUMNS))}) "
+        "ON CONFLICT(game_id) DO UPDATE SET "
+        + ", ".join(
+            f"{column} = COALESCE(excluded.{column}, games.{column})"
+            for column in _INSERT_COLUMNS
+            if column not in ("game_id", "created_at", "updated_at")
+        )
+        + ", updated_at = excluded.updated_at"
+    )
+
     def save_game_record(self, game_record: GameRecord) -> int:
         """Save or update game record in database.
         
@@ -76,111 +104,54 @@ class GameRecordManager:
         self._validate_game_record(game_record)
         
         with sqlite3.connect(self.db_path) as conn:
-            # Check if record already exists
-            existing_cursor = conn.execute("SELECT * FROM games WHERE game_id = ?", (game_record.game_id,))
-            existing_record = existing_cursor.fetchone()
+            conn.execute(self._UPSERT_SQL, self._insert_values(game_record, datetime.now(datetime_utc)))
             
-            if existing_record:
-                # Build dynamic update that preserves non-null existing values
-                update_parts = []
-                update_values = []
-                
-                # Define all updateable fields with their values
-                field_mapping = {
-                    "home_team_id": game_record.home_team_id,
-                    "away_team_id": game_record.away_team_id,
-                    "date": game_record.date,
-                    "game_type": game_record.game_type,
-                    "season": game_record.season,
-                    "division": game_record.division,
-                    "country": game_record.country,
-                    "cup_round": game_record.cup_round,
-                    "score_home": game_record.score_home,
-                    "score_away": game_record.score_away,
-                    "bleachers_attendance": game_record.bleachers_attendance,
-                    "lower_tier_attendance": game_record.lower_tier_attendance,
-                    "courtside_attendance": game_record.courtside_attendance,
-                    "luxury_boxes_attendance": game_record.luxury_boxes_attendance,
-                    "neutral_arena": game_record.neutral_arena,
-                    "ticket_revenue": game_record.ticket_revenue,
-                    "bleachers_price": game_record.bleachers_price,
-                    "lower_tier_price": game_record.lower_tier_price,
-                    "courtside_price": game_record.courtside_price,
-                    "luxury_boxes_price": game_record.luxury_boxes_price,
-                }
-                
-                # For each field, only update if new value is not None (don't overwrite existing data with null)
-                for field_name, new_value in field_mapping.items():
-                    if new_value is not None:
-                        update_parts.append(f"{field_name} = ?")
-                        update_values.append(new_value)
-                
-                # Always update timestamp
-                update_parts.append("updated_at = ?")
-                update_values.append(datetime.now(datetime_utc))
-                update_values.append(game_record.game_id)  # For WHERE clause
-                
-                if update_parts:
-                    cursor = conn.execute(
-                        f"UPDATE games SET {', '.join(update_parts)} WHERE game_id = ?",
-                        update_values
-                    )
-                    
-                    # Get the database ID
-                    id_cursor = conn.execute("SELECT id FROM games WHERE game_id = ?", (game_record.game_id,))
-                    return id_cursor.fetchone()[0]
-            else:
-                # Insert new record
-                columns = [
-                    "game_id", "home_team_id", "away_team_id", "date", "game_type",
-                    "season", "division", "country", "cup_round",
-                    "score_home", "score_away", "bleachers_attendance",
-                    "lower_tier_attendance", "courtside_attendance",
-                    "luxury_boxes_attendance", "total_attendance", "neutral_arena",
-                    "ticket_revenue", "bleachers_price", "lower_tier_price", 
-                    "courtside_price", "luxury_boxes_price", "created_at", "updated_at"
-                ]
-                placeholders = ", ".join(["?"] * len(columns))
-                columns_str = ", ".join(columns)
-                
-                cursor = conn.execute(
-                    f"""
-                    INSERT INTO games ({columns_str}) 
-                    VALUES ({placeholders})
-                """,
-                    (
-                        game_record.game_id,
-                        game_record.home_team_id,
-                        game_record.away_team_id,
-                        game_record.date,
-                        game_record.game_type,
-                        game_record.season,
-                        game_record.division,
-                        game_record.country,
-                        game_record.cup_round,
-                        game_record.score_home,
-                        game_record.score_away,
-                        game_record.bleachers_attendance,
-                        game_record.lower_tier_attendance,
-                        game_record.courtside_attendance,
-                        game_record.luxury_boxes_attendance,
-                        game_record.total_attendance,
-                        game_record.neutral_arena,
-                        game_record.ticket_revenue,
-                        game_record.bleachers_price,
-                        game_record.lower_tier_price,
-                        game_record.courtside_price,
-                        game_record.luxury_boxes_price,
-                        game_record.created_at,
-                        datetime.now(datetime_utc),
-                    ),
-                )
-                
-                conn.commit()
-                row_id = cursor.lastrowid
-                if row_id is None:
-                    raise ValueError("Failed to insert game record")
-                return row_id
+            # lastrowid is not reliable when the upsert updated an existing row
+            id_cursor = conn.execute("SELECT id FROM games WHERE game_id = ?", (game_record.game_id,))
+            row = id_cursor.fetchone()
+            if row is None:
+                raise ValueError("Failed to insert game record")
+            return row[0]
+
+    def save_game_records(self, game_records: list[GameRecord]) -> int:
+        """Save or update many game records in a single transaction.
+        
+        Applies the same rules as save_game_record, but runs one executemany
+        upsert for the whole batch. Invalid records are skipped.
+
+        Args:
+            game_records: GameRecord instances to save
+
+        Returns:
+            Number of records saved
+        """
+        # Keyed by game ID so a repeated game is written once, with its latest record
+        records_by_id: dict[str, GameRecord] = {}
+        for game_record in game_records:
+            try:
+                self._validate_game_record(game_record)
+            except ValueError as e:
+                logger.warning(f"⚠️ Skipping game {game_record.game_id}: {e}")
+                continue
+            records_by_id[game_record.game_id] = game_record
+        
+        if not records_by_id:
+            return 0
+        
+        # One timestamp for the whole batch instead of a clock read per row
+        now = datetime.now(datetime_utc)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(self._UPSERT_SQL, [
+                self._insert_values(game_record, now)
+                for game_record in records_by_id.values()
+            ])
+        
+        return len(records_by_id)
+
+    def _insert_values(self, game_record: GameRecord, now: datetime) -> tuple:
+        """Get the upsert parameters for a game record, in _INSERT_COLUMNS order, stamped with now."""
+        return self._RECORD_VALUES(game_record) + (now,)
 
     def get_games_for_team(
         self, team_id: str, limit: int | None = None
@@ -205,46 +176,78 @@ class GameRecordManager:
                 params.append(limit)
 
             cursor = conn.execute(query, params)
+            return self._game_records_from_cursor(cursor)
 
-            games = []
-            for row in cursor.fetchall():
-                games.append(
-                    GameRecord(
-                        game_id=row["game_id"],
-                        id=row["id"],
-                        home_team_id=row["home_team_id"],
-                        away_team_id=row["away_team_id"],
-                        date=datetime.fromisoformat(row["date"])
-                        if row["date"]
-                        else None,
-                        game_type=row["game_type"],
-                        season=row["season"],
-                        division=row["division"],
-                        country=row["country"],
-                        cup_round=row["cup_round"],
-                        score_home=row["score_home"],
-                        score_away=row["score_away"],
-                        bleachers_attendance=row["bleachers_attendance"],
-                        lower_tier_attendance=row["lower_tier_attendance"],
-                        courtside_attendance=row["courtside_attendance"],
-                        luxury_boxes_attendance=row["luxury_boxes_attendance"],
-                        neutral_arena=bool(row["neutral_arena"]),
-                        ticket_revenue=row["ticket_revenue"],
-                        calculated_revenue=row["calculated_revenue"] if "calculated_revenue" in row.keys() else None,
-                        bleachers_price=row["bleachers_price"],
-                        lower_tier_price=row["lower_tier_price"],
-                        courtside_price=row["courtside_price"],
-                        luxury_boxes_price=row["luxury_boxes_price"],
-                        created_at=datetime.fromisoformat(row["created_at"])
-                        if row["created_at"]
-                        else None,
-                        updated_at=datetime.fromisoformat(row["updated_at"])
-                        if row["updated_at"]
-                        else None,
-                    )
+    def get_home_games_missing_scores(self, team_id: int) -> list[GameRecord]:
+        """Get a team's non-neutral home games that are still missing a score.
+
+        Filtering in SQL means only the games a score update can change are
+        turned into GameRecords.
+
+        Args:
+            team_id: Team ID of the home team
+
+        Returns:
+            List of GameRecord instances, newest first
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(
+                """SELECT * FROM games
+                   WHERE home_team_id = ? AND neutral_arena = FALSE
+                     AND (score_home IS NULL OR score_away IS NULL)
+                   ORDER BY date DESC""",
+                (team_id,),
+            )
+            return self._game_records_from_cursor(cursor)
+
+    def _game_records_from_cursor(self, cursor: sqlite3.Cursor) -> list[GameRecord]:
+        """Build GameRecords from a SELECT * FROM games cursor using sqlite3.Row rows."""
+        # The column set is the same for every row, so check it once rather than
+        # building row.keys() per game
+        has_calculated_revenue = any(
+            column[0] == "calculated_revenue" for column in cursor.description
+        )
+
+        games = []
+        for row in cursor.fetchall():
+            games.append(
+                GameRecord(
+                    game_id=row["game_id"],
+                    id=row["id"],
+                    home_team_id=row["home_team_id"],
+                    away_team_id=row["away_team_id"],
+                    date=datetime.fromisoformat(row["date"])
+                    if row["date"]
+                    else None,
+                    game_type=row["game_type"],
+                    season=row["season"],
+                    division=row["division"],
+                    country=row["country"],
+                    cup_round=row["cup_round"],
+                    score_home=row["score_home"],
+                    score_away=row["score_away"],
+                    bleachers_attendance=row["bleachers_attendance"],
+                    lower_tier_attendance=row["lower_tier_attendance"],
+                    courtside_attendance=row["courtside_attendance"],
+                    luxury_boxes_attendance=row["luxury_boxes_attendance"],
+                    neutral_arena=bool(row["neutral_arena"]),
+                    ticket_revenue=row["ticket_revenue"],
+                    calculated_revenue=row["calculated_revenue"] if has_calculated_revenue else None,
+                    bleachers_price=row["bleachers_price"],
+                    lower_tier_price=row["lower_tier_price"],
+                    courtside_price=row["courtside_price"],
+                    luxury_boxes_price=row["luxury_boxes_price"],
+                    created_at=datetime.fromisoformat(row["created_at"])
+                    if row["created_at"]
+                    else None,
+                    updated_at=datetime.fromisoformat(row["updated_at"])
+                    if row["updated_at"]
+                    else None,
                 )
+            )
 
-            return games
+        return games
 
     def get_game_by_id(self, game_id: str) -> GameRecord | None:
         """Get a specific game by its game_id.
@@ -299,6 +302,40 @@ class GameRecordManager:
 
             return None
 
+    def get_stored_game_ids(self, game_ids: list[str]) -> frozenset[str]:
+        """Get which of the given game IDs are stored, with one query per batch of IDs.
+
+        Args:
+            game_ids: Game IDs to look up
+
+        Returns:
+            The subset of game_ids present in the games table
+        """
+        return frozenset(self.get_game_attendances(game_ids))
+
+    def get_game_attendances(self, game_ids: list[str]) -> dict[str, int | None]:
+        """Get the stored total attendance of the given games over a single connection.
+
+        Args:
+            game_ids: Game IDs to look up
+
+        Returns:
+            Mapping of each stored game ID to its total attendance (None if not recorded);
+            IDs missing from the games table are left out
+        """
+        unique_ids = list(dict.fromkeys(game_ids))
+        attendances: dict[str, int | None] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            # Stay well below SQLite's host parameter limit
+            for start in range(0, len(unique_ids), 500):
+                batch = unique_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT game_id, total_attendance FROM games WHERE game_id IN ({placeholders})", batch
+                )
+                attendances.update(cursor)
+        return attendances
+
     def get_prefix_max_attendance(self, team_id: str, up_to_date: str) -> dict[str, int]:
         """Get the maximum attendance for each section from all home games up to a specific date.
         
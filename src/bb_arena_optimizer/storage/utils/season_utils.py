@@ -11,6 +11,11 @@ from ...utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _assume_utc(value: datetime) -> datetime:
+    """Make a loaded datetime timezone-aware, treating naive values as UTC."""
+    return value.replace(tzinfo=datetime_utc) if value.tzinfo is None else value
+
+
 class SeasonManager:
     """Manages season database operations."""
     
@@ -138,20 +143,14 @@ class SeasonManager:
         # If the latest season has an end date and it has passed, we might need new seasons
         if latest_season.end_date:
             # Ensure both datetimes are timezone-aware for comparison
-            end_date = latest_season.end_date
-            if end_date.tzinfo is None:
-                # If loaded date is naive, assume it's UTC
-                end_date = end_date.replace(tzinfo=datetime_utc)
+            end_date = _assume_utc(latest_season.end_date)
             if end_date < now:
                 return True
             
         # If the latest season doesn't have an end date, check if it's been running too long
         # by comparing to historical season durations
         if not latest_season.end_date and latest_season.start_date:
-            start_date = latest_season.start_date
-            if start_date.tzinfo is None:
-                # If loaded date is naive, assume it's UTC
-                start_date = start_date.replace(tzinfo=datetime_utc)
+            start_date = _assume_utc(latest_season.start_date)
             current_season_duration = (now - start_date).days
             
             # Get the maximum duration of all completed seasons as our threshold
@@ -173,10 +172,7 @@ class SeasonManager:
                 
         # Check if we haven't updated seasons in a while (every 7 days)
         if latest_season.created_at:
-            created_at = latest_season.created_at
-            if created_at.tzinfo is None:
-                # If loaded date is naive, assume it's UTC
-                created_at = created_at.replace(tzinfo=datetime_utc)
+            created_at = _assume_utc(latest_season.created_at)
             days_since_update = (now - created_at).days
             if days_since_update > 7:
                 return True
@@ -196,11 +192,9 @@ class SeasonManager:
             return None
             
         try:
-            # Parse the date string, handling timezone info
-            target_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            # Convert to naive datetime for comparison
-            if target_date.tzinfo is not None:
-                target_date = target_date.replace(tzinfo=None)
+            # Parse the date string, handling timezone info. An offset is kept as is:
+            # SQLite's datetime() normalizes it to UTC, so no naive copy is needed
+            target_date = datetime.fromisoformat(date_str)
         except (ValueError, TypeError):
             logger.warning(f"Could not parse date: {date_str}")
             return None
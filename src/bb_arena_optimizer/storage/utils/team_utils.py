@@ -385,6 +385,41 @@ class TeamInfoManager:
             conn.commit()
             logger.info(f"Saved {len(history_entries)} league history entries for team {team_id}")
 
+    def save_team_league_history_bulk(self, team_id: int, raw_entries: list[dict[str, Any]]) -> None:
+        """Save parsed team history rows in one transaction without building model objects.
+        
+        Args:
+            team_id: Team ID
+            raw_entries: History dictionaries as returned by
+                BuzzerBeaterAPI.get_team_history_from_webpage
+        """
+        if not raw_entries:
+            return
+        
+        created_at = datetime.now(datetime_utc).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO team_league_history (
+                    team_id, season, team_name, league_id, league_name, 
+                    league_level, achievement, is_active_team, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    team_id,
+                    entry['season'],
+                    entry['team_name'],
+                    entry['league_id'],
+                    entry['league_name'],
+                    entry.get('league_level'),
+                    entry.get('achievement'),
+                    entry.get('is_active_team', True),
+                    created_at
+                )
+                for entry in raw_entries
+            ])
+            conn.commit()
+            logger.info(f"Saved {len(raw_entries)} league history entries for team {team_id}")
+
     def get_team_league_history(self, team_id: int, active_only: bool = True) -> list[TeamLeagueHistory]:
         """Get team league history from database.
         
@@ -480,7 +515,6 @@ class TeamInfoManager:
             import os
             from dotenv import load_dotenv
             from ...api.client import BuzzerBeaterAPI
-            from ..models import TeamLeagueHistory
             
             # Load environment variables
             load_dotenv()
@@ -495,23 +529,8 @@ class TeamInfoManager:
             history_data = api_client.get_team_history_from_webpage(team_id)
             
             if history_data:
-                # Convert dictionary data to TeamLeagueHistory objects
-                history_entries = []
-                for entry_dict in history_data:
-                    history_entry = TeamLeagueHistory.from_webpage_data(
-                        team_id=str(team_id),
-                        season=entry_dict['season'],
-                        team_name=entry_dict['team_name'],
-                        league_id=entry_dict['league_id'],
-                        league_name=entry_dict['league_name'],
-                        league_level=entry_dict['league_level'],
-                        achievement=entry_dict.get('achievement'),
-                        is_active_team=entry_dict.get('is_active_team', True)
-                    )
-                    history_entries.append(history_entry)
-                
-                self.save_team_league_history(team_id, history_entries)
-                logger.info(f"Successfully collected and saved {len(history_entries)} history entries for team {team_id}")
+                self.save_team_league_history_bulk(team_id, history_data)
+                logger.info(f"Successfully collected and saved {len(history_data)} history entries for team {team_id}")
                 return True
             else:
                 logger.warning(f"No history entries found for team {team_id}")
@@ -3,6 +3,8 @@
 import re
 from datetime import datetime
 
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
 
 def calculate_moving_average(values: list[float], window: int = 5) -> list[float]:
     """Calculate moving average of a list of values.
@@ -31,6 +33,41 @@ def calculate_moving_average(values: list[float], window: int = 5) -> list[float
     return moving_averages
 
 
+# ISO dates with optional time, which datetime.fromisoformat parses in C without
+# the format matching strptime does
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2})?")
+
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+)
+
+# Format order per string shape, so the expected format is tried first and
+# failed strptime attempts (each raising ValueError) are avoided
+_DATE_FORMATS_BY_SHAPE = {
+    shape: (fmt,) + tuple(other for other in _DATE_FORMATS if other != fmt)
+    for shape, fmt in (
+        ("T", "%Y-%m-%dT%H:%M:%S"),
+        ("/", "%m/%d/%Y"),
+        (" ", "%Y-%m-%d %H:%M:%S"),
+        ("", "%Y-%m-%d"),
+    )
+}
+
+
+def _date_formats_for(date_string: str) -> tuple[str, ...]:
+    """Get the candidate date formats for a string, most likely first."""
+    if "T" in date_string:
+        return _DATE_FORMATS_BY_SHAPE["T"]
+    if "/" in date_string:
+        return _DATE_FORMATS_BY_SHAPE["/"]
+    if " " in date_string:
+        return _DATE_FORMATS_BY_SHAPE[" "]
+    return _DATE_FORMATS_BY_SHAPE[""]
+
+
 def parse_bb_date(date_string: str) -> datetime | None:
     """Parse BuzzerBeater date string to datetime object.
 
@@ -44,19 +81,12 @@ def parse_bb_date(date_string: str) -> datetime | None:
         return None
 
     try:
-        # Handle ISO format with Z timezone
-        if date_string.endswith("Z"):
-            return datetime.fromisoformat(date_string.replace("Z", "+00:00"))
-
-        # Handle other common formats
-        date_formats = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-        ]
-
-        for fmt in date_formats:
+        # fromisoformat handles a trailing Z timezone on its own
+        if date_string.endswith("Z") or _ISO_DATE_RE.fullmatch(date_string):
+            return datetime.fromisoformat(date_string)
+
+        # Handle other common formats, trying the one matching the string's shape first
+        for fmt in _date_formats_for(date_string):
             try:
                 return datetime.strptime(date_string, fmt)
             except ValueError:
@@ -128,7 +158,7 @@ def normalize_team_name(team_name: str) -> str:
         return ""
 
     # Remove extra whitespace and convert to title case
-    normalized = re.sub(r"\s+", " ", team_name.strip()).title()
+    normalized = _WHITESPACE_RUN_RE.sub(" ", team_name.strip()).title()
 
     # Handle common abbreviations
     abbreviations = {"Fc": "FC", "Bc": "BC", "Cc": "CC", "Ac": "AC"}
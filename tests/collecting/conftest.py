@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the collecting tests.
+"""
+
+import asyncio
+
+import pytest
+
+from bb_arena_optimizer.api.client import BuzzerBeaterAPI
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace asyncio.sleep with a no-op and collect the requested delays."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def requested_urls() -> list[str]:
+    """Collect the URLs requested through the client session."""
+    return []
+
+
+@pytest.fixture
+def api_responses() -> dict[str, bytes]:
+    """Response bodies served by the fake session, keyed by endpoint; override per module."""
+    return {}
+
+
+@pytest.fixture
+def api(
+    requested_urls: list[str], api_responses: dict[str, bytes], monkeypatch: pytest.MonkeyPatch
+) -> BuzzerBeaterAPI:
+    """Get an authenticated client whose session answers from api_responses."""
+    api = BuzzerBeaterAPI("user", "code")
+    api._authenticated = True
+
+    def fake_get(url: str, params: dict) -> FakeResponse:
+        requested_urls.append(url)
+        return FakeResponse(api_responses[url.rsplit("/", 1)[1]])
+
+    monkeypatch.setattr(api.session, "get", fake_get)
+    return api
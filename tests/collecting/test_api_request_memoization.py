@@ -0,0 +1,98 @@
+"""
+API Request Memoization Tests
+
+Tests that BuzzerBeaterAPI reuses schedule and team info responses within one client,
+and keeps schedules of finished seasons in the opt-in on-disk cache.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from bb_arena_optimizer.api.client import BuzzerBeaterAPI
+
+RESPONSES = {
+    "schedule.aspx": b"""<bbapi>
+<schedule teamid="5">
+  <match id="11" start="2025-01-04T18:00:00Z" type="league.rs">
+    <homeTeam id="5"><score>80</score></homeTeam>
+    <awayTeam id="6"><score>70</score></awayTeam>
+  </match>
+</schedule>
+</bbapi>""",
+    "teaminfo.aspx": b"""<bbapi>
+<team id="5"><teamName>Team 5</teamName></team>
+</bbapi>""",
+}
+
+
+@pytest.fixture
+def api_responses() -> dict[str, bytes]:
+    """Serve the schedule and team info responses."""
+    return RESPONSES
+
+
+class TestRequestMemoization:
+    """Test suite for get_schedule and get_team_info memoization."""
+
+    def test_schedule_is_fetched_once_per_team_and_season(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str]
+    ) -> None:
+        """Test: Repeating a schedule call reuses the response, a different season does not."""
+        first = api.get_schedule(5, 69)
+        second = api.get_schedule(5, 69)
+        api.get_schedule(5, 68)
+
+        assert first is not None
+        assert first is second
+        assert [match["match_id"] for match in first["matches"]] == [11]
+        assert len(requested_urls) == 2
+
+    def test_cached_schedule_lookup_never_requests(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str]
+    ) -> None:
+        """Test: get_cached_schedule only answers from the cache and never hits the network."""
+        assert api.get_cached_schedule(5, 69) is None
+        schedule = api.get_schedule(5, 69)
+
+        assert api.get_cached_schedule(5, 69) is schedule
+        assert len(requested_urls) == 1
+
+    def test_team_info_is_fetched_once_per_team(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str]
+    ) -> None:
+        """Test: Team info for the same team is requested only once per client."""
+        assert api.get_team_info(5) == {"id": "5", "name": "Team 5"}
+        assert api.get_team_info(5) == {"id": "5", "name": "Team 5"}
+        assert len(requested_urls) == 1
+
+    def test_failed_requests_are_not_memoized(self) -> None:
+        """Test: A call that fails is not cached, so the next call tries again."""
+        api = BuzzerBeaterAPI("user", "code")
+
+        assert api.get_team_info(5) is None
+        assert api._team_info_cache == {}
+
+    def test_finished_schedule_is_reused_across_clients(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: A finished season's schedule is written to disk and read back by a new client."""
+        monkeypatch.setenv("BB_SCHEDULE_CACHE_DIR", str(tmp_path))
+
+        first = api.get_schedule(5, 68, finished=True)
+        fresh_api = BuzzerBeaterAPI("user", "code")
+        second = fresh_api.get_schedule(5, 68, finished=True)
+
+        assert first is not None
+        assert first == second
+        assert len(requested_urls) == 1
+        assert (tmp_path / "5-68.json").exists()
+
+    def test_running_season_schedule_is_not_written_to_disk(
+        self, api: BuzzerBeaterAPI, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: Schedules of seasons that are not finished stay out of the on-disk cache."""
+        monkeypatch.setenv("BB_SCHEDULE_CACHE_DIR", str(tmp_path))
+
+        assert api.get_schedule(5, 69) is not None
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,90 @@
+"""
+Arena Batch Update Tests
+
+Tests for updating pricing from the arena webpages of several teams at once.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from bb_arena_optimizer.api.routers import collecting
+
+
+class TestArenaBatchUpdate:
+    """Test suite for update_pricing_from_arena_webpages."""
+
+    def test_concurrency_is_capped_and_failures_are_per_team(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: At most max_concurrency teams run at once and one failure does not abort the batch."""
+        active = 0
+        peak = 0
+
+        async def fake_update(team_id: int, db_manager) -> collecting.ArenaUpdateResponse:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            if team_id == 3:
+                raise HTTPException(status_code=404, detail="Arena table not found on webpage")
+            return collecting.ArenaUpdateResponse(
+                message="ok", team_id=team_id, periods_created=1, games_updated=2
+            )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(collecting, "_update_team_pricing_from_arena", fake_update)
+        monkeypatch.setattr(collecting, "_ARENA_REQUEST_DELAY", 0.0)
+
+        request = collecting.ArenaBatchUpdateRequest(team_ids=[1, 2, 3, 4, 2], max_concurrency=2)
+        response = asyncio.run(collecting.update_pricing_from_arena_webpages(request))
+
+        assert peak == 2
+        assert sorted(result.team_id for result in response.results) == [1, 2, 4]
+        assert response.failed_teams == {3: "Arena table not found on webpage"}
+
+    def test_concurrency_outside_cap_is_rejected(self) -> None:
+        """Test: max_concurrency must lie between 1 and the webpage cap; other values are not clamped."""
+        cap = collecting.RateLimitConfig.max_concurrent_requests
+
+        assert collecting.ArenaBatchUpdateRequest(team_ids=[1]).max_concurrency == cap
+        for max_concurrency in (0, cap + 1):
+            with pytest.raises(ValidationError):
+                collecting.ArenaBatchUpdateRequest(team_ids=[1], max_concurrency=max_concurrency)
+
+    def test_request_gap_does_not_shrink_with_concurrency(
+        self, sleeps: list[float], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: Fetch starts stay one fixed delay apart even at the highest concurrency."""
+        async def fake_update(team_id: int, db_manager) -> collecting.ArenaUpdateResponse:
+            return collecting.ArenaUpdateResponse(
+                message="ok", team_id=team_id, periods_created=1, games_updated=2
+            )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(collecting, "_update_team_pricing_from_arena", fake_update)
+
+        request = collecting.ArenaBatchUpdateRequest(team_ids=[1, 2, 3], max_concurrency=4)
+        asyncio.run(collecting.update_pricing_from_arena_webpages(request))
+
+        delay = collecting._ARENA_REQUEST_DELAY
+        assert delay == collecting.RateLimitConfig.min_delay_between_requests
+        assert len(sleeps) == 2
+        assert delay - 0.1 < sleeps[0] <= delay
+        assert 2 * delay - 0.1 < sleeps[1] <= 2 * delay
+
+    def test_spacer_shares_one_schedule(self, sleeps: list[float]) -> None:
+        """Test: Concurrent callers are started one interval apart instead of all at once."""
+        async def run_callers() -> None:
+            spacer = collecting._RequestSpacer(0.5)
+            await asyncio.gather(*(spacer.wait() for _ in range(3)))
+
+        asyncio.run(run_callers())
+
+        assert len(sleeps) == 2
+        assert 0.4 < sleeps[0] <= 0.5
+        assert 0.9 < sleeps[1] <= 1.0
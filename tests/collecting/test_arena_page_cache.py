@@ -0,0 +1,97 @@
+"""
+Arena Page Cache Tests
+
+Tests for the opt-in on-disk cache used when fetching arena webpages.
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from bb_arena_optimizer.api.routers import collecting
+
+
+class FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+
+    status_code = 200
+    text = "<html><table id='cphContent_seatingStats'></table></html>"
+    headers: dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class TestArenaPageCache:
+    """Test suite for _fetch_arena_webpage caching."""
+
+    @pytest.fixture
+    def fetched_urls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record requests made through the shared arena session."""
+        urls: list[str] = []
+
+        def fake_get(url: str, timeout: int, headers: dict[str, str]) -> FakeResponse:
+            urls.append(url)
+            return FakeResponse()
+
+        monkeypatch.setattr(collecting._arena_session, "get", fake_get)
+        return urls
+
+    def test_cache_disabled_by_default(self, fetched_urls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test: Without BB_ARENA_CACHE_DIR every call goes to the network."""
+        monkeypatch.delenv("BB_ARENA_CACHE_DIR", raising=False)
+
+        collecting._fetch_arena_webpage(1)
+        collecting._fetch_arena_webpage(1)
+
+        assert len(fetched_urls) == 2
+
+    def test_cached_page_is_reused(
+        self, fetched_urls: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: A second fetch on the same day reads the cached page."""
+        monkeypatch.setenv("BB_ARENA_CACHE_DIR", str(tmp_path))
+
+        first = collecting._fetch_arena_webpage(1)
+        second = collecting._fetch_arena_webpage(1)
+
+        assert first == second == FakeResponse.text
+        assert len(fetched_urls) == 1
+        assert len(list(tmp_path.glob("1-*.html.gz"))) == 1
+
+    def test_cache_can_be_bypassed(
+        self, fetched_urls: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: use_cache=False always fetches and leaves the cache untouched."""
+        monkeypatch.setenv("BB_ARENA_CACHE_DIR", str(tmp_path))
+
+        collecting._fetch_arena_webpage(1, use_cache=False)
+
+        assert len(fetched_urls) == 1
+        assert not list(tmp_path.iterdir())
+
+    def test_older_page_is_revalidated(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test: An older cached page with an ETag is reused when the server answers 304."""
+        monkeypatch.setenv("BB_ARENA_CACHE_DIR", str(tmp_path))
+        old_page = tmp_path / "1-2000-01-01.html.gz"
+        old_page.write_bytes(gzip.compress(b"<html>old</html>"))
+        (tmp_path / "1-2000-01-01.json").write_text(json.dumps({"ETag": '"abc"'}))
+        sent_headers: list[dict[str, str]] = []
+
+        class NotModifiedResponse(FakeResponse):
+            status_code = 304
+            text = ""
+
+        def fake_get(url: str, timeout: int, headers: dict[str, str]) -> FakeResponse:
+            sent_headers.append(headers)
+            return NotModifiedResponse()
+
+        monkeypatch.setattr(collecting._arena_session, "get", fake_get)
+
+        assert collecting._fetch_arena_webpage(1) == "<html>old</html>"
+        assert sent_headers == [{"If-None-Match": '"abc"'}]
+        assert not old_page.exists()
+        assert len(list(tmp_path.glob("1-*.html.gz"))) == 1
+        assert len(list(tmp_path.glob("1-*.json"))) == 1
@@ -139,6 +139,8 @@ class TestArenaRowParsing:
         assert len(parsed_objects) == 1
         assert isinstance(parsed_objects[0], GameEvent)
         assert parsed_objects[0].game_id == "12345"
+        # The skipped short row still consumes a table position
+        assert parsed_objects[0].row_index == 1
 
 
 def test_arena_row_parsing_integration() -> None:
@@ -66,6 +66,26 @@ class TestArenaTableIsolation:
         table = isolator.find_attendance_table(invalid_html)
         assert table is None, "Should return None for HTML without attendance table"
     
+    def test_isolation_when_id_appears_outside_a_table(self, isolator: ArenaTableIsolator) -> None:
+        """Test: Mentioning the table ID elsewhere does not produce a false match."""
+        html = "<html><body><div id='cphContent_seatingStats'>Not a table</div></body></html>"
+        
+        table = isolator.find_attendance_table(html)
+        assert table is None, "Should return None when the ID is not on a table"
+    
+    def test_isolation_when_id_is_referenced_before_the_table(self, isolator: ArenaTableIsolator) -> None:
+        """Test: An earlier mention of the ID (e.g. in a script) still finds the real table."""
+        html = (
+            "<html><body><table id='nav'><tr><td>menu</td></tr></table>"
+            "<script>var statsId = 'cphContent_seatingStats';</script>"
+            "<table id='cphContent_seatingStats'><tr class='tableHeader'><th>Date</th></tr></table>"
+            "</body></html>"
+        )
+        
+        table = isolator.find_attendance_table(html)
+        assert table is not None, "Should fall back to parsing the whole page"
+        assert table.get('id') == 'cphContent_seatingStats'
+    
     def test_isolation_roundtrip(self, arena_html: str, isolator: ArenaTableIsolator) -> None:
         """Test: Can we extract the table and it remains functional?"""
         table = isolator.find_attendance_table(arena_html)
@@ -0,0 +1,57 @@
+"""
+Boxscore Cache Tests
+
+Tests for the opt-in on-disk cache used by BuzzerBeaterAPI.get_boxscore.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from bb_arena_optimizer.api.client import BuzzerBeaterAPI
+
+BOXSCORE_XML = b"""<bbapi>
+<match id="11" type="league.rs">
+  <startTime>2025-01-04T18:00:00Z</startTime>
+  <neutral>0</neutral>
+  <attendance><bleachers>900</bleachers><lowerTier>300</lowerTier><courtside>50</courtside><luxury>10</luxury></attendance>
+  <homeTeam id="5"><score>80</score></homeTeam>
+  <awayTeam id="6"><score>70</score></awayTeam>
+</match>
+</bbapi>"""
+
+
+@pytest.fixture
+def api_responses() -> dict[str, bytes]:
+    """Serve the played game's boxscore."""
+    return {"boxscore.aspx": BOXSCORE_XML}
+
+
+class TestBoxscoreCache:
+    """Test suite for get_boxscore caching."""
+
+    def test_cache_disabled_by_default(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test: Without BB_BOXSCORE_CACHE_DIR every call goes to the network."""
+        monkeypatch.delenv("BB_BOXSCORE_CACHE_DIR", raising=False)
+
+        api.get_boxscore("11")
+        api.get_boxscore("11")
+
+        assert len(requested_urls) == 2
+
+    def test_cached_boxscore_is_reused(
+        self, api: BuzzerBeaterAPI, requested_urls: list[str], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test: A played game's boxscore is fetched once and then read from disk."""
+        monkeypatch.setenv("BB_BOXSCORE_CACHE_DIR", str(tmp_path))
+
+        first = api.get_boxscore("11")
+        second = api.get_boxscore("11")
+
+        assert first is not None
+        assert first == second
+        assert first["bleachers_attendance"] == 900
+        assert len(requested_urls) == 1
+        assert (tmp_path / "11.json").exists()
@@ -0,0 +1,112 @@
+"""
+Database Manager Tests
+
+Tests for DatabaseManager setup, bulk game saves, index deferral and statistics.
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from bb_arena_optimizer.storage.database import DatabaseManager
+from bb_arena_optimizer.storage.models import GameRecord
+
+
+class TestSaveGameRecords:
+    """Test suite for DatabaseManager.save_game_records."""
+
+    def test_inserts_new_and_updates_existing_games(self, tmp_path: Path) -> None:
+        """Test: New games are inserted, stored games keep their non-null values, invalid ones are skipped."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        db_manager.save_game_record(GameRecord(
+            game_id="1", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 1),
+            game_type="league.rs", season=69, bleachers_price=20,
+        ))
+
+        saved = db_manager.save_game_records([
+            GameRecord(game_id="1", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 1),
+                       game_type="league.rs", season=69, bleachers_attendance=900),
+            GameRecord(game_id="2", home_team_id=5, away_team_id=7, date=datetime(2025, 1, 8),
+                       game_type="league.rs", season=69, bleachers_attendance=950),
+            GameRecord(game_id="3", home_team_id=5, away_team_id=8),
+        ])
+
+        assert saved == 2
+        first = db_manager.get_game_by_id("1")
+        assert first is not None
+        assert (first.bleachers_price, first.bleachers_attendance) == (20, 900)
+        assert db_manager.get_game_attendances(["1", "2", "3"]) == {"1": 900, "2": 950}
+
+
+class TestHomeGamesMissingScores:
+    """Test suite for DatabaseManager.get_home_games_missing_scores."""
+
+    def test_only_unscored_home_games_are_returned(self, tmp_path: Path) -> None:
+        """Test: Scored, away and neutral-venue games are filtered out by the query."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        db_manager.save_game_records([
+            GameRecord(game_id="1", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 1),
+                       game_type="league.rs", season=69, score_home=80, score_away=70),
+            GameRecord(game_id="2", home_team_id=5, away_team_id=7, date=datetime(2025, 1, 8),
+                       game_type="league.rs", season=69),
+            GameRecord(game_id="3", home_team_id=8, away_team_id=5, date=datetime(2025, 1, 15),
+                       game_type="league.rs", season=69),
+            GameRecord(game_id="4", home_team_id=5, away_team_id=9, date=datetime(2025, 1, 22),
+                       game_type="cup", season=69, neutral_arena=True),
+            GameRecord(game_id="5", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 29),
+                       game_type="league.rs", season=69, score_home=75),
+        ])
+
+        games = db_manager.get_home_games_missing_scores(5)
+
+        assert [game.game_id for game in games] == ["5", "2"]
+
+
+class TestDatabaseSetup:
+    """Test suite for DatabaseManager setup, index management and statistics."""
+
+    def test_database_uses_write_ahead_log(self, tmp_path: Path) -> None:
+        """Test: A new database is switched to WAL journaling for cheaper commits."""
+        DatabaseManager(tmp_path / "test.db")
+
+        with sqlite3.connect(tmp_path / "test.db") as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_game_indexes_are_rebuilt_after_bulk_load(self, tmp_path: Path) -> None:
+        """Test: Secondary game indexes are dropped inside the block and restored afterwards."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+
+        def game_indexes() -> set[str]:
+            with sqlite3.connect(tmp_path / "test.db") as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'games' AND sql IS NOT NULL"
+                ).fetchall()
+            return {name for (name,) in rows}
+
+        with db_manager.deferred_game_indexes():
+            assert game_indexes() == set()
+            db_manager.save_game_records([
+                GameRecord(game_id="1", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 1),
+                           game_type="league.rs", season=69),
+            ])
+
+        assert game_indexes() == set(DatabaseManager._GAME_INDEXES)
+        assert db_manager.get_stored_game_ids(["1"]) == {"1"}
+
+    def test_database_stats(self, tmp_path: Path) -> None:
+        """Test: Table counts, the game date range and distinct teams come from one query."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        db_manager.save_game_records([
+            GameRecord(game_id="1", home_team_id=5, away_team_id=6, date=datetime(2025, 1, 1),
+                       game_type="league.rs", season=69),
+            GameRecord(game_id="2", home_team_id=6, away_team_id=7, date=datetime(2025, 1, 8),
+                       game_type="league.rs", season=69),
+        ])
+
+        stats = db_manager.get_database_stats()
+
+        assert stats["arena_snapshots"] == stats["price_snapshots"] == 0
+        assert stats["total_games"] == 2
+        assert stats["earliest_game"].startswith("2025-01-01")
+        assert stats["latest_game"].startswith("2025-01-08")
+        assert stats["unique_teams"] == 3
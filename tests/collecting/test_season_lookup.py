@@ -0,0 +1,46 @@
+"""
+Season Lookup Tests
+
+Tests for the pure season range helpers used to map game dates to seasons.
+"""
+
+import math
+from datetime import UTC, datetime
+
+from bb_arena_optimizer.collecting.season_lookup import build_season_ranges, parse_game_date, resolve_season
+from bb_arena_optimizer.storage.models import Season
+
+
+class TestSeasonLookup:
+    """Test suite for build_season_ranges and resolve_season."""
+
+    def test_ranges_are_sorted_and_skip_incomplete_seasons(self) -> None:
+        """Test: Ranges come back sorted by start and seasons without a start date are dropped."""
+        ranges = build_season_ranges([
+            Season(season_number=69, start_date=datetime(2025, 1, 1, tzinfo=UTC), end_date=None),
+            Season(season_number=67, start_date=None, end_date=None),
+            Season(season_number=68, start_date=datetime(2024, 9, 1), end_date=datetime(2024, 12, 15)),
+        ])
+
+        assert [season for _, _, season in ranges] == [68, 69]
+        assert ranges[0][0] == datetime(2024, 9, 1, tzinfo=UTC).timestamp()
+        assert ranges[1][1] == math.inf
+
+    def test_resolve_season_boundaries(self) -> None:
+        """Test: Start and end dates are inclusive and gaps resolve to None."""
+        ranges = build_season_ranges([
+            Season(season_number=68, start_date=datetime(2024, 9, 1, tzinfo=UTC), end_date=datetime(2024, 12, 15, tzinfo=UTC)),
+            Season(season_number=69, start_date=datetime(2025, 1, 1, tzinfo=UTC), end_date=None),
+        ])
+        starts = [start for start, _, _ in ranges]
+
+        assert resolve_season(datetime(2024, 9, 1, tzinfo=UTC), ranges, starts) == 68
+        assert resolve_season(datetime(2024, 12, 15, tzinfo=UTC), ranges, starts) == 68
+        assert resolve_season(datetime(2024, 12, 20, tzinfo=UTC), ranges, starts) is None
+        assert resolve_season(datetime(2030, 1, 1), ranges, starts) == 69
+        assert resolve_season(datetime(2020, 1, 1, tzinfo=UTC), [], []) is None
+
+    def test_parse_game_date_accepts_trailing_z(self) -> None:
+        """Test: A trailing 'Z' parses as UTC and repeated strings come from the cache."""
+        assert parse_game_date("2025-01-04T18:00:00Z") == datetime(2025, 1, 4, 18, tzinfo=UTC)
+        assert parse_game_date("2025-01-04T18:00:00Z") is parse_game_date("2025-01-04T18:00:00Z")
@@ -0,0 +1,321 @@
+"""
+Task-Based Collector Tests
+
+Tests for the pure helper logic of TaskBasedCollector that does not need
+network access.
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from bb_arena_optimizer.api.client import BuzzerBeaterAPI, ScheduleData
+from bb_arena_optimizer.collecting.task_based_collector import RateLimitConfig, TaskBasedCollector, TaskResult
+from bb_arena_optimizer.storage.database import DatabaseManager
+from bb_arena_optimizer.storage.models import Season
+
+
+class TestGameCompletion:
+    """Test suite for TaskBasedCollector._is_game_completed."""
+
+    @pytest.fixture
+    def collector(self, tmp_path: Path) -> TaskBasedCollector:
+        """Get a collector backed by a throwaway database."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        return TaskBasedCollector(api=None, db_manager=db_manager)  # type: ignore[arg-type]
+
+    def test_parsed_scores_mark_game_completed(self, collector: TaskBasedCollector) -> None:
+        """Test: Both parsed scores present means the game was played."""
+        game = {"match_id": 1, "home_score": 80, "away_score": 75}
+        assert collector._is_game_completed(game, 69)
+
+    def test_missing_away_score_is_not_completed(self, collector: TaskBasedCollector) -> None:
+        """Test: A single parsed score is not enough for a current season."""
+        game = {"match_id": 2, "home_score": 80, "away_score": None}
+        assert not collector._is_game_completed(game, 69)
+
+    def test_alternative_score_field_marks_game_completed(self, collector: TaskBasedCollector) -> None:
+        """Test: Alternative score fields are honoured when set."""
+        assert collector._is_game_completed({"match_id": 3, "scores": "80-75"}, 69)
+        assert not collector._is_game_completed({"match_id": 4, "score": None}, 69)
+
+    def test_historical_season_is_always_completed(self, collector: TaskBasedCollector) -> None:
+        """Test: Games from finished seasons are assumed to be played."""
+        assert collector._is_game_completed({"match_id": 5}, 68)
+
+    def test_completion_is_cached_per_game_and_season(self, collector: TaskBasedCollector) -> None:
+        """Test: A game is classified once per season until the cache is cleared."""
+        game = {"match_id": 6, "home_score": None, "away_score": None}
+        assert not collector._is_game_completed(game, 69)
+
+        game["home_score"], game["away_score"] = 80, 75
+        assert not collector._is_game_completed(game, 69)
+        assert collector._is_game_completed(game, 70)
+
+        collector._completed_cache.clear()
+        assert collector._is_game_completed(game, 69)
+
+
+class TestSeasonResolution:
+    """Test suite for resolving a game's season from cached season ranges."""
+
+    @pytest.fixture
+    def collector(self, tmp_path: Path) -> TaskBasedCollector:
+        """Get a collector whose database holds one finished and one current season."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        db_manager.save_seasons([
+            Season(season_number=68, start_date=datetime(2024, 9, 1, tzinfo=UTC), end_date=datetime(2024, 12, 15, tzinfo=UTC)),
+            Season(season_number=69, start_date=datetime(2025, 1, 1, tzinfo=UTC), end_date=None),
+        ])
+        return TaskBasedCollector(api=None, db_manager=db_manager)  # type: ignore[arg-type]
+
+    def test_date_inside_finished_season(self, collector: TaskBasedCollector) -> None:
+        """Test: A date within a season's start and end resolves to that season."""
+        assert collector._resolve_season("2024-10-05T18:00:00Z") == 68
+
+    def test_date_in_current_season_without_end(self, collector: TaskBasedCollector) -> None:
+        """Test: The open-ended current season covers any later date."""
+        assert collector._resolve_season("2025-06-01T18:00:00+00:00") == 69
+
+    def test_date_outside_any_season(self, collector: TaskBasedCollector) -> None:
+        """Test: Dates before the first season or in an off-season gap resolve to None."""
+        assert collector._resolve_season("2024-01-01T00:00:00Z") is None
+        assert collector._resolve_season("2024-12-20T00:00:00Z") is None
+
+    def test_unparseable_date(self, collector: TaskBasedCollector) -> None:
+        """Test: Invalid date strings resolve to None instead of raising."""
+        assert collector._resolve_season("not a date") is None
+
+    def test_only_seasons_with_past_end_are_finished(self, collector: TaskBasedCollector) -> None:
+        """Test: A season with a past end date is finished; the open or unknown ones are not."""
+        assert collector._is_season_finished(68)
+        assert not collector._is_season_finished(69)
+        assert not collector._is_season_finished(70)
+
+
+class TestSaveTaskResult:
+    """Test suite for TaskBasedCollector.save_task_result."""
+
+    def test_writes_json_with_set_data_as_list(self, tmp_path: Path) -> None:
+        """Test: Saved results are valid JSON and sets become lists."""
+        collector = TaskBasedCollector(api=None, db_manager=DatabaseManager(tmp_path / "test.db"))  # type: ignore[arg-type]
+        result = TaskResult(task_name="collect_team_ids", success=True, data={7, 3}, items_processed=2)
+
+        collector.save_task_result(result, output_dir=str(tmp_path / "results"))
+
+        saved_files = list((tmp_path / "results").glob("collect_team_ids_*.json"))
+        assert len(saved_files) == 1
+        saved = json.loads(saved_files[0].read_text())
+        assert saved["success"] is True
+        assert sorted(saved["data"]) == [3, 7]
+
+
+class TestRateLimiting:
+    """Test suite for the rate limit budget shared by all collector tasks."""
+
+    def test_per_minute_budget_is_shared_by_concurrent_callers(
+        self, sleeps: list[float], tmp_path: Path
+    ) -> None:
+        """Test: Once the per-minute budget is used up, the next caller waits for the window."""
+        rate_config = RateLimitConfig(requests_per_minute=2, min_delay_between_requests=0.0)
+        collector = TaskBasedCollector(
+            api=None, db_manager=DatabaseManager(tmp_path / "test.db"), rate_config=rate_config  # type: ignore[arg-type]
+        )
+
+        async def run_callers() -> None:
+            await asyncio.gather(*(collector._respect_rate_limits() for _ in range(3)))
+
+        asyncio.run(run_callers())
+
+        assert collector.request_count == 3
+        assert len(sleeps) == 1
+        assert 55.0 < sleeps[0] <= 60.0
+
+
+class TestTeamHistoryCollection:
+    """Test suite for TaskBasedCollector.task_4_collect_team_history."""
+
+    class FakeAPI:
+        """API stub that returns one history row per team, except for team 3."""
+
+        def get_team_history_from_webpage(self, team_id: int) -> list[dict]:
+            if team_id == 3:
+                return []
+            return [{
+                "season": 68,
+                "team_name": f"Team {team_id}",
+                "league_id": 100,
+                "league_name": "League",
+                "league_level": 2,
+            }]
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_collects_all_teams_and_reports_failures(
+        self, tmp_path: Path
+    ) -> None:
+        """Test: Teams are scraped concurrently, saved in bulk, and empty pages count as failures."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        collector = TaskBasedCollector(
+            api=self.FakeAPI(), db_manager=db_manager,  # type: ignore[arg-type]
+            rate_config=RateLimitConfig(min_delay_between_requests=0.0)
+        )
+
+        result = asyncio.run(collector.task_4_collect_team_history({1, 2, 3}))
+
+        assert result.data["successful"] == 2
+        assert result.data["failed_teams"] == [3]
+        assert result.data["total_history_entries"] == 2
+        assert [entry.team_name for entry in db_manager.get_team_league_history(2)] == ["Team 2"]
+
+    def test_scrapes_are_paced_only_by_shared_budget(
+        self, sleeps: list[float], tmp_path: Path
+    ) -> None:
+        """Test: With budget to spare, history scrapes run without any fixed sleep."""
+        collector = TaskBasedCollector(
+            api=self.FakeAPI(), db_manager=DatabaseManager(tmp_path / "test.db"),  # type: ignore[arg-type]
+            rate_config=RateLimitConfig(min_delay_between_requests=0.0)
+        )
+
+        asyncio.run(collector.task_4_collect_team_history({1, 2}))
+
+        assert sleeps == []
+        assert collector.request_count == 2
+
+
+class TestHomeGameCollection:
+    """Test suite for TaskBasedCollector._collect_team_games_for_seasons."""
+
+    SCHEDULE_XML = """<bbapi>
+<schedule teamid="5">
+  <match id="11" start="2025-01-04T18:00:00Z" type="league.rs">
+    <homeTeam id="5"><score>80</score></homeTeam><awayTeam id="6"><score>70</score></awayTeam>
+  </match>
+  <match id="12" start="2025-01-08T18:00:00Z" type="league.rs">
+    <homeTeam id="5"><score>81</score></homeTeam><awayTeam id="7"><score>71</score></awayTeam>
+  </match>
+  <match id="13" start="2025-01-11T18:00:00Z" type="league.rs">
+    <homeTeam id="5"><score>82</score></homeTeam><awayTeam id="8"><score>72</score></awayTeam>
+  </match>
+  <match id="14" start="2025-01-15T18:00:00Z" type="league.rs">
+    <homeTeam id="9"><score>83</score></homeTeam><awayTeam id="5"><score>73</score></awayTeam>
+  </match>
+  <match id="15" start="2025-01-18T18:00:00Z" type="league.rs">
+    <homeTeam id="5"></homeTeam><awayTeam id="10"></awayTeam>
+  </match>
+</schedule>
+</bbapi>"""
+
+    class FakeAPI:
+        """API stub serving a parsed schedule: three played home games, one away game
+        and one unplayed home game; game 12 has no boxscore."""
+
+        def __init__(self, schedule_xml: str, schedule_cached: bool = False) -> None:
+            self.schedule_xml = schedule_xml
+            self.schedule_cached = schedule_cached
+            self.schedule_calls: list[tuple[int, int]] = []
+
+        def _parse_schedule(self, season: int) -> ScheduleData:
+            parser = BuzzerBeaterAPI("user", "code")
+            return parser._parse_schedule_data(ET.fromstring(self.schedule_xml), season)
+
+        def get_cached_schedule(self, team_id: int, season: int, finished: bool = False) -> ScheduleData | None:
+            return self._parse_schedule(season) if self.schedule_cached else None
+
+        def get_schedule(self, team_id: int, season: int, finished: bool = False) -> ScheduleData:
+            self.schedule_calls.append((team_id, season))
+            return self._parse_schedule(season)
+
+        def get_boxscore(self, game_id: str) -> dict | None:
+            if game_id == "12":
+                return None
+            return {
+                "match_id": game_id, "start_date": "2025-01-04T18:00:00Z",
+                "home_team_id": 5, "away_team_id": 6, "game_type": "league.rs", "neutral": False,
+                "home_score": 80, "away_score": 70, "bleachers_attendance": 900,
+                "lower_tier_attendance": 300, "courtside_attendance": 50, "luxury_box_attendance": 10,
+            }
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_fetches_missing_home_games_and_saves_them_together(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test: Only unstored home games are fetched, and fetched ones are saved in one batch."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        db_manager.save_seasons([
+            Season(season_number=69, start_date=datetime(2025, 1, 1, tzinfo=UTC), end_date=None),
+        ])
+        api = self.FakeAPI(self.SCHEDULE_XML)
+        collector = TaskBasedCollector(
+            api=api, db_manager=db_manager,  # type: ignore[arg-type]
+            rate_config=RateLimitConfig(min_delay_between_requests=0.0)
+        )
+        saved_batches: list[int] = []
+        save_game_records = db_manager.save_game_records
+
+        def recording_save(game_records: list) -> int:
+            saved_batches.append(len(game_records))
+            return save_game_records(game_records)
+
+        monkeypatch.setattr(db_manager, "save_game_records", recording_save)
+
+        collected, skipped = asyncio.run(collector._collect_team_games_for_seasons(5, [69]))
+
+        assert (collected, skipped) == (2, 0)
+        assert saved_batches == [2]
+        assert db_manager.get_game_attendances(["11", "12", "13"]) == {"11": 1260, "13": 1260}
+        assert api.schedule_calls == [(5, 69)]
+
+        # A second run finds both games stored with attendance and only retries game 12
+        collected, skipped = asyncio.run(collector._collect_team_games_for_seasons(5, [69]))
+        assert (collected, skipped) == (0, 2)
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_cached_schedule_takes_no_rate_limit_slot(
+        self, tmp_path: Path
+    ) -> None:
+        """Test: A schedule served from the client cache is not counted as a request."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        api = self.FakeAPI(self.SCHEDULE_XML, schedule_cached=True)
+        collector = TaskBasedCollector(
+            api=api, db_manager=db_manager,  # type: ignore[arg-type]
+            rate_config=RateLimitConfig(min_delay_between_requests=0.0)
+        )
+
+        asyncio.run(collector._collect_team_games_for_seasons(5, [69]))
+
+        # Only the three played home games' boxscores were requested
+        assert api.schedule_calls == []
+        assert collector.request_count == 3
+
+
+class TestTeamInfoCollection:
+    """Test suite for TaskBasedCollector.task_2_collect_team_info."""
+
+    class FakeAPI:
+        """API stub that returns team info for every team except team 3."""
+
+        def get_team_info(self, team_id: int) -> dict | None:
+            if team_id == 3:
+                return None
+            return {"id": team_id, "name": f"Team {team_id}"}
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_collects_all_teams_and_reports_failures(
+        self, tmp_path: Path
+    ) -> None:
+        """Test: Teams are fetched concurrently and missing info counts as a failure."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        collector = TaskBasedCollector(
+            api=self.FakeAPI(), db_manager=db_manager,  # type: ignore[arg-type]
+            rate_config=RateLimitConfig(min_delay_between_requests=0.0)
+        )
+
+        result = asyncio.run(collector.task_2_collect_team_info({1, 2, 3}))
+
+        assert result.data["successful"] == 2
+        assert result.data["failed_teams"] == [3]
+        assert collector.request_count == 3
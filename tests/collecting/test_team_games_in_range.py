@@ -0,0 +1,71 @@
+"""
+Team Games In Range Tests
+
+Tests for the game lookups PricePeriod and the games API run against the database.
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from bb_arena_optimizer.collecting.arena_row import GameEvent
+from bb_arena_optimizer.collecting.price_period import validate_games_in_database
+from bb_arena_optimizer.storage.database import DatabaseManager
+
+
+class TestTeamGamesInTimeRange:
+    """Test suite for DatabaseManager.get_team_games_in_time_range and the bulk game ID lookups."""
+
+    @pytest.fixture
+    def db_manager(self, tmp_path: Path) -> DatabaseManager:
+        """Get a database with three home games and one away game for team 5."""
+        db_manager = DatabaseManager(tmp_path / "test.db")
+        with sqlite3.connect(db_manager.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO games (game_id, home_team_id, away_team_id, date, game_type, season) "
+                "VALUES (?, ?, ?, ?, 'league.rs', 69)",
+                [
+                    ("1", 5, 6, "2025-01-01T10:00:00"),
+                    ("2", 5, 7, "2025-01-02T10:00:00"),
+                    ("3", 5, 8, "2025-01-03T10:00:00"),
+                    ("4", 9, 5, "2025-01-04T10:00:00"),
+                ],
+            )
+        return db_manager
+
+    def test_home_games_in_range(self, db_manager: DatabaseManager) -> None:
+        """Test: Only home games inside the range come back, ordered by date."""
+        games = db_manager.get_team_games_in_time_range("5", datetime(2025, 1, 1), datetime(2025, 1, 31))
+        assert [game.game_id for game in games] == ["1", "2", "3"]
+
+    def test_excluded_games_are_filtered_by_the_query(self, db_manager: DatabaseManager) -> None:
+        """Test: Game IDs passed as exclude_game_ids are left out."""
+        games = db_manager.get_team_games_in_time_range(
+            "5", datetime(2025, 1, 1), datetime(2025, 1, 31), exclude_game_ids=frozenset({"1", "3"})
+        )
+        assert [game.game_id for game in games] == ["2"]
+
+    def test_stored_game_ids(self, db_manager: DatabaseManager) -> None:
+        """Test: Only the IDs present in the games table are reported as stored."""
+        assert db_manager.get_stored_game_ids(["2", "99", "4", "2"]) == frozenset({"2", "4"})
+        assert db_manager.get_stored_game_ids([]) == frozenset()
+
+    def test_validate_games_reports_only_missing_games(self, db_manager: DatabaseManager) -> None:
+        """Test: Validation checks all arena games in one lookup and names the unknown ones."""
+        validate_games_in_database([GameEvent(row_index=0, game_id="1", date_raw="1/1/2025")], db_manager)
+
+        with pytest.raises(ValueError, match="game_id 99 not found") as excinfo:
+            validate_games_in_database([
+                GameEvent(row_index=0, game_id="2", date_raw="1/2/2025"),
+                GameEvent(row_index=1, game_id="99", date_raw="1/3/2025"),
+            ], db_manager)
+        assert "game_id 2 " not in str(excinfo.value)
+
+    def test_game_attendances(self, db_manager: DatabaseManager) -> None:
+        """Test: Stored games map to their total attendance and unknown IDs are left out."""
+        with sqlite3.connect(db_manager.db_path) as conn:
+            conn.execute("UPDATE games SET total_attendance = 1200 WHERE game_id = '3'")
+
+        assert db_manager.get_game_attendances(["1", "3", "99"]) == {"1": None, "3": 1200}